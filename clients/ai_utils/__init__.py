@@ -1,6 +1,27 @@
-from .ai_utils_client.data_ingestor_client import (
-    DataIngestorClient as DataIngestorClient,
-)
-from .ai_utils_client.data_processor_client import (
-    DataProcessorClient as DataProcessorClient,
+from typing import TYPE_CHECKING
+
+from clients.core_lib.core_lib_client.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .ai_utils_client.categorical_encoder import (
+        CategoricalEncoder as CategoricalEncoder,
+    )
+    from .ai_utils_client.data_ingestor_client import (
+        DataIngestorClient as DataIngestorClient,
+    )
+    from .ai_utils_client.data_processor_client import (
+        DataProcessorClient as DataProcessorClient,
+    )
+
+__all__: list[str] = ["CategoricalEncoder", "DataIngestorClient", "DataProcessorClient"]
+
+# Promoted names are imported on first access, so pandas and the Drive stack
+# are only loaded once a client is actually used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CategoricalEncoder": ".ai_utils_client.categorical_encoder",
+        "DataIngestorClient": ".ai_utils_client.data_ingestor_client",
+        "DataProcessorClient": ".ai_utils_client.data_processor_client",
+    },
 )
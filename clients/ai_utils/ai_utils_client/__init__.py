@@ -1,2 +1,19 @@
-from .data_ingestor_client import DataIngestorClient as DataIngestorClient
-from .data_processor_client import DataProcessorClient as DataProcessorClient
+from typing import TYPE_CHECKING
+
+from clients.core_lib.core_lib_client.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .categorical_encoder import CategoricalEncoder as CategoricalEncoder
+    from .data_ingestor_client import DataIngestorClient as DataIngestorClient
+    from .data_processor_client import DataProcessorClient as DataProcessorClient
+
+__all__: list[str] = ["CategoricalEncoder", "DataIngestorClient", "DataProcessorClient"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CategoricalEncoder": ".categorical_encoder",
+        "DataIngestorClient": ".data_ingestor_client",
+        "DataProcessorClient": ".data_processor_client",
+    },
+)
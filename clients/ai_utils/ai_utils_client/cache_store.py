@@ -0,0 +1,252 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO, Final
+
+from clients.core_lib.core_lib_client.file_lock import atomic_write, file_lock
+from clients.core_lib.core_lib_client.logger_client import logger
+
+DEFAULT_CACHE_DIR: Final[str] = "data/cache"
+DEFAULT_MAX_BYTES: Final[int] = 5 * 1024**3
+
+
+class CacheStore:
+    """
+    Content-addressed file cache shared by every job on a host.
+
+    Entries are keyed by the source identity (e.g. Drive file ID + checksum),
+    so a changed source simply maps to a new key and stale files age out.
+    A JSON manifest records size and last access of every entry; when the
+    total exceeds 'max_bytes' the least recently used entries are evicted.
+    Files are written to a temporary name and renamed into place, manifest
+    updates happen under a file lock, and each key has its own lock so two
+    jobs asking for the same missing entry download it only once.
+    """
+
+    def __init__(self, root: str | None = None, max_bytes: int | None = None) -> None:
+        """
+        Args:
+            root (Optional[str]): Cache directory. Defaults to AI_UTILS_CACHE_DIR
+                or DEFAULT_CACHE_DIR.
+            max_bytes (Optional[int]): Byte budget. Defaults to
+                AI_UTILS_CACHE_MAX_BYTES or DEFAULT_MAX_BYTES.
+        """
+        self.root: str = root or os.getenv("AI_UTILS_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_bytes: int = (
+            max_bytes
+            if max_bytes is not None
+            else int(os.getenv("AI_UTILS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        )
+        self.manifest_path: str = os.path.join(self.root, "manifest.json")
+        Path(self.root, ".locks").mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Derives a stable entry key from the parts identifying a source."""
+        raw: str = json.dumps([str(p) for p in parts])
+        return hashlib.sha256(raw.encode()).hexdigest()[:40]
+
+    # --- Lookups ---
+
+    def open(self, key: str) -> BinaryIO | None:
+        """
+        Opens a cached entry for reading and marks it as recently used.
+
+        The handle is opened while the manifest lock is held, so a concurrent
+        eviction can unlink the file but never pull it from under a reader.
+
+        Args:
+            key (str): Entry key (see make_key).
+
+        Returns:
+            Optional[BinaryIO]: An open binary handle, or None on a miss.
+        """
+        with file_lock(self.manifest_path):
+            manifest: dict[str, Any] = self._load()
+            entry: dict[str, Any] | None = manifest.get(key)
+            if entry is None:
+                return None
+            path: str = os.path.join(self.root, entry["file"])
+            if not os.path.exists(path):
+                # Removed behind our back (manual cleanup): forget it
+                del manifest[key]
+                self._save(manifest)
+                return None
+
+            entry["last_access"] = time.time()
+            self._save(manifest)
+            return open(path, "rb")
+
+    def entry(self, key: str) -> dict[str, Any] | None:
+        """Returns the manifest record of an entry (without touching it)."""
+        with file_lock(self.manifest_path):
+            return self._load().get(key)
+
+    def latest(self, **match: Any) -> str | None:
+        """
+        Returns the key of the newest entry whose manifest fields match.
+
+        Args:
+            **match: Manifest fields and the values they must equal
+                (e.g. file_id="...").
+
+        Returns:
+            Optional[str]: The most recently stored matching key, or None.
+        """
+        with file_lock(self.manifest_path):
+            manifest: dict[str, Any] = self._load()
+        candidates: list[tuple[float, str]] = [
+            (entry["created"], key)
+            for key, entry in manifest.items()
+            if all(entry.get(field) == value for field, value in match.items())
+        ]
+        return max(candidates)[1] if candidates else None
+
+    # --- Population ---
+
+    def fetch(
+        self,
+        key: str,
+        download: Callable[[str], None],
+        suffix: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> BinaryIO:
+        """
+        Returns the entry for 'key', downloading it first on a miss.
+
+        Args:
+            key (str): Entry key (see make_key).
+            download (Callable[[str], None]): Writes the content to the path it
+                is given (a temporary file inside the cache directory).
+            suffix (str): File extension of the entry (e.g. ".csv").
+            metadata (Optional[Dict[str, Any]]): Extra fields stored in the manifest.
+
+        Returns:
+            BinaryIO: An open binary handle on the cached file.
+        """
+        handle: BinaryIO | None = self.open(key)
+        if handle is not None:
+            return handle
+
+        # Only one job downloads a given entry; the others wait and then hit
+        with file_lock(os.path.join(self.root, ".locks", key)):
+            handle = self.open(key)
+            if handle is not None:
+                return handle
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".", suffix=".part")
+            os.close(fd)
+            try:
+                download(tmp_path)
+                return self._commit(key, tmp_path, suffix, metadata or {})
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    # --- Maintenance ---
+
+    def discard(self, key: str) -> None:
+        """Removes one entry (e.g. to force a fresh download)."""
+        with file_lock(self.manifest_path):
+            manifest: dict[str, Any] = self._load()
+            entry: dict[str, Any] | None = manifest.pop(key, None)
+            if entry is None:
+                return
+            path: str = os.path.join(self.root, entry["file"])
+            if os.path.exists(path):
+                os.remove(path)
+            self._save(manifest)
+
+    def evict(self, max_bytes: int | None = None) -> list[str]:
+        """
+        Removes least recently used entries until the cache fits the budget.
+
+        Args:
+            max_bytes (Optional[int]): Budget to enforce. Defaults to self.max_bytes.
+
+        Returns:
+            List[str]: Keys of the evicted entries.
+        """
+        with file_lock(self.manifest_path):
+            manifest: dict[str, Any] = self._load()
+            evicted: list[str] = self._evict(manifest, max_bytes, keep=None)
+            if evicted:
+                self._save(manifest)
+        return evicted
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Number of entries, total bytes and the byte budget.
+        """
+        with file_lock(self.manifest_path):
+            manifest: dict[str, Any] = self._load()
+        return {
+            "entries": len(manifest),
+            "bytes": sum(e["size"] for e in manifest.values()),
+            "max_bytes": self.max_bytes,
+        }
+
+    # --- Internals ---
+
+    def _commit(
+        self, key: str, tmp_path: str, suffix: str, metadata: dict[str, Any]
+    ) -> BinaryIO:
+        file_name: str = f"{key}{suffix}"
+        with file_lock(self.manifest_path):
+            os.replace(tmp_path, os.path.join(self.root, file_name))
+            # Open before unlocking: a later commit may evict the entry, but
+            # this handle keeps its content readable
+            handle: BinaryIO = open(os.path.join(self.root, file_name), "rb")
+            try:
+                manifest: dict[str, Any] = self._load()
+                now: float = time.time()
+                manifest[key] = {
+                    **metadata,
+                    "file": file_name,
+                    "size": os.fstat(handle.fileno()).st_size,
+                    "created": now,
+                    "last_access": now,
+                }
+                self._evict(manifest, None, keep=key)
+                self._save(manifest)
+            except BaseException:
+                handle.close()
+                raise
+        return handle
+
+    def _evict(
+        self, manifest: dict[str, Any], max_bytes: int | None, keep: str | None
+    ) -> list[str]:
+        budget: int = self.max_bytes if max_bytes is None else max_bytes
+        total: int = sum(e["size"] for e in manifest.values())
+        evicted: list[str] = []
+        for key in sorted(manifest, key=lambda k: manifest[k]["last_access"]):
+            if total <= budget:
+                break
+            if key == keep:
+                continue
+            entry: dict[str, Any] = manifest.pop(key)
+            path: str = os.path.join(self.root, entry["file"])
+            if os.path.exists(path):
+                os.remove(path)
+            total -= entry["size"]
+            evicted.append(key)
+
+        if evicted:
+            logger.info(f">>> Cache eviction: removed {len(evicted)} entries")
+        return evicted
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.manifest_path) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, manifest: dict[str, Any]) -> None:
+        atomic_write(self.manifest_path, json.dumps(manifest))
@@ -0,0 +1,276 @@
+# automation-hub/ai_utils_client/categorical_encoder.py
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+# Separator between the column name and the level in dummy column names
+PREFIX_SEP: Final[str] = "_"
+# dense bool/uint8 frames, a frame of pandas sparse columns, or a CSR matrix
+OUTPUT_MODES: Final[tuple[str, ...]] = ("bool", "uint8", "sparse", "csr")
+
+
+class CategoricalEncoder:
+    """
+    One-Hot encoder with a vocabulary learned once and reused everywhere.
+
+    pd.get_dummies derives its columns from the frame it is given, so two
+    chunks (or train and inference data) can come out with different
+    layouts. This encoder learns the levels of each column first, either
+    in one call to fit or incrementally with partial_fit over chunks, and
+    then maps any frame onto the same columns through category codes.
+    Levels are ordered like pd.get_dummies orders them: by the categorical
+    dtype's categories when the column has one, sorted otherwise.
+
+    Levels unseen during fitting encode as all zeros, like missing values.
+    With drop_first, all zeros is also the code of the dropped reference
+    level, so unseen values cannot be told apart from it; use
+    drop_first=False when that matters.
+
+    High-cardinality columns can be capped with 'max_levels': only the most
+    frequent levels get their own dummy and the rest (including levels
+    unseen during fitting) share an "other" bucket. With drop_first, that
+    bucket is the dropped reference level of a capped column, so every
+    frequent level keeps its dummy. 'output' picks a
+    compact representation: dense bool/uint8, pandas sparse columns, or a
+    scipy CSR matrix of the dummies alone.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        drop_first: bool = True,
+        max_levels: int | None = None,
+        output: str = "bool",
+        other_label: str = "other",
+    ) -> None:
+        """
+        Args:
+            columns (List[str]): Columns to encode.
+            drop_first (bool): Whether to drop the first level of each column
+                (the "other" bucket of a column capped by max_levels) to
+                prevent multicollinearity. Defaults to True. Unseen levels
+                then encode like the dropped level.
+            max_levels (Optional[int]): Dummies kept per column; rarer levels
+                fold into the 'other_label' bucket. None keeps every level.
+            output (str): One of OUTPUT_MODES. "csr" returns only the dummy
+                block (see feature_names_ for its columns).
+            other_label (str): Level name of the bucket for folded levels. A
+                real level with this name is folded into the bucket.
+        """
+        if output not in OUTPUT_MODES:
+            raise ValueError(f"output must be one of {OUTPUT_MODES}, got {output!r}")
+        if max_levels is not None and max_levels < 1:
+            raise ValueError("max_levels must be at least 1")
+
+        self.columns: list[str] = list(columns)
+        self.drop_first: bool = drop_first
+        self.max_levels: int | None = max_levels
+        self.output: str = output
+        self.other_label: str = other_label
+        self.categories_: dict[str, list[Any]] = {}
+        # Columns whose last category is the "other" bucket
+        self.folded_: set[str] = set()
+        self._counts: dict[str, Counter[Any]] = {c: Counter() for c in self.columns}
+        # Category order of the columns seen with a categorical dtype
+        self._orders: dict[str, dict[Any, None]] = {}
+
+    # --- Fitting ---
+
+    def partial_fit(self, df: pd.DataFrame) -> "CategoricalEncoder":
+        """
+        Adds the levels found in one chunk to the vocabulary.
+
+        Args:
+            df (pd.DataFrame): A chunk holding every encoded column.
+
+        Returns:
+            CategoricalEncoder: The encoder itself, for chaining.
+        """
+        _require_columns(df, self.columns)
+        for column in self.columns:
+            series: pd.Series = df[column]
+            counts: Counter[Any] = self._counts[column]
+            counts.update(series.value_counts(dropna=True).to_dict())
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                order: dict[Any, None] = self._orders.setdefault(column, {})
+                order.update(dict.fromkeys(series.cat.categories))
+
+            levels: list[Any] = list(counts)
+            if self.max_levels is not None and len(levels) > self.max_levels:
+                # Keep the most frequent levels; ties break on the level text.
+                # A real level named like the bucket joins it (no duplicate).
+                levels = sorted(
+                    (v for v in levels if v != self.other_label),
+                    key=lambda v: (-counts[v], str(v)),
+                )
+                self.categories_[column] = [
+                    *_sorted_levels(
+                        set(levels[: self.max_levels]), self._orders.get(column)
+                    ),
+                    self.other_label,
+                ]
+                self.folded_.add(column)
+            else:
+                self.categories_[column] = _sorted_levels(
+                    set(levels), self._orders.get(column)
+                )
+                self.folded_.discard(column)
+        return self
+
+    def fit(self, data: pd.DataFrame | Iterable[pd.DataFrame]) -> "CategoricalEncoder":
+        """
+        Learns the vocabulary from scratch.
+
+        Args:
+            data (pd.DataFrame | Iterable[pd.DataFrame]): A frame, or chunks
+                streamed one at a time (e.g. iter_spreadsheet_chunks).
+
+        Returns:
+            CategoricalEncoder: The fitted encoder.
+        """
+        self._counts = {column: Counter() for column in self.columns}
+        self.categories_ = {}
+        self.folded_ = set()
+        self._orders = {}
+        for chunk in [data] if isinstance(data, pd.DataFrame) else data:
+            self.partial_fit(chunk)
+        return self
+
+    # --- Encoding ---
+
+    @property
+    def feature_names_(self) -> list[str]:
+        """Names of the dummy columns produced by transform, in order."""
+        return [
+            f"{column}{PREFIX_SEP}{level}"
+            for column in self.columns
+            for level in self._kept_levels(column)
+        ]
+
+    def transform(self, df: pd.DataFrame) -> "pd.DataFrame | sparse.csr_matrix":
+        """
+        Encodes a frame into the fitted column layout.
+
+        Args:
+            df (pd.DataFrame): The frame (or chunk) to encode.
+
+        Returns:
+            pd.DataFrame | sparse.csr_matrix: The non-encoded columns followed
+            by the dummies, or (output="csr") the dummies as a uint8 matrix.
+        """
+        if not self.categories_:
+            raise ValueError("CategoricalEncoder must be fitted before transform")
+        _require_columns(df, self.columns)
+
+        # 1. Locate the ones: one (row, feature) pair per encoded cell
+        rows: list[np.ndarray] = []
+        features: list[np.ndarray] = []
+        offset: int = 0
+        for column in self.columns:
+            codes: np.ndarray = self._codes(df[column])
+            if self.drop_first and column in self.folded_:
+                # The trailing "other" bucket is the reference: all zeros
+                codes[codes == len(self.categories_[column]) - 1] = -1
+            elif self.drop_first:
+                codes = codes - 1
+            known: np.ndarray = codes >= 0
+            rows.append(np.flatnonzero(known))
+            features.append(codes[known] + offset)
+            offset += len(self._kept_levels(column))
+
+        row_index: np.ndarray = np.concatenate(rows) if rows else np.empty(0, int)
+        feature_index: np.ndarray = (
+            np.concatenate(features) if features else np.empty(0, int)
+        )
+        shape: tuple[int, int] = (len(df), offset)
+
+        # 2. Materialize them in the requested representation
+        if self.output in ("csr", "sparse"):
+            from scipy import sparse
+
+            matrix: sparse.csr_matrix = sparse.csr_matrix(
+                (np.ones(len(row_index), dtype=np.uint8), (row_index, feature_index)),
+                shape=shape,
+            )
+            if self.output == "csr":
+                return matrix
+            dummies: pd.DataFrame = pd.DataFrame.sparse.from_spmatrix(
+                matrix, index=df.index, columns=self.feature_names_
+            )
+        else:
+            dense: np.ndarray = np.zeros(shape, dtype=self.output)
+            dense[row_index, feature_index] = 1
+            dummies = pd.DataFrame(dense, index=df.index, columns=self.feature_names_)
+
+        return pd.concat([df.drop(columns=self.columns), dummies], axis=1)
+
+    def fit_transform(self, df: pd.DataFrame) -> "pd.DataFrame | sparse.csr_matrix":
+        """Fits on 'df' and encodes it."""
+        return self.fit(df).transform(df)
+
+    # --- Persistence ---
+
+    def save(self, path: str) -> None:
+        """Serializes the fitted encoder with joblib."""
+        import joblib
+
+        joblib.dump(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CategoricalEncoder":
+        """
+        Restores an encoder saved with save.
+
+        Args:
+            path (str): File written by save (trusted input: joblib unpickles).
+
+        Returns:
+            CategoricalEncoder: The fitted encoder.
+        """
+        import joblib
+
+        encoder: Any = joblib.load(path)
+        if not isinstance(encoder, cls):
+            raise TypeError(f"{path} does not hold a {cls.__name__}")
+        return encoder
+
+    def _codes(self, series: pd.Series) -> np.ndarray:
+        """Positions of the values in the fitted levels (-1: no dummy)."""
+        levels: list[Any] = self.categories_[series.name]
+        codes: np.ndarray = pd.Index(levels).get_indexer(series)
+        if series.name in self.folded_:
+            # Rare and unseen levels land in the trailing "other" bucket
+            codes[(codes == -1) & series.notna().to_numpy()] = len(levels) - 1
+        return codes
+
+    def _kept_levels(self, column: str) -> list[Any]:
+        levels: list[Any] = self.categories_.get(column, [])
+        if not self.drop_first:
+            return levels
+        return levels[:-1] if column in self.folded_ else levels[1:]
+
+
+def _require_columns(df: pd.DataFrame, columns: list[str]) -> None:
+    missing: list[str] = [column for column in columns if column not in df.columns]
+    if missing:
+        raise ValueError(f"Columns missing from the frame: {missing}")
+
+
+def _sorted_levels(levels: set[Any], order: dict[Any, None] | None = None) -> list[Any]:
+    """
+    Ordered like pd.get_dummies: by the categorical 'order' when there is one
+    (other levels last), else sorted, mixed types by their text form.
+    """
+    if order:
+        rank: dict[Any, int] = {level: i for i, level in enumerate(order)}
+        return sorted(levels, key=lambda v: (rank.get(v, len(rank)), str(v)))
+    try:
+        return sorted(levels)
+    except TypeError:
+        return sorted(levels, key=str)
@@ -1,10 +1,42 @@
 # automation-hub/ai_utils_client/data_ingestor_client.py
+import hashlib
+import io
+import mmap
+import multiprocessing
 import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Any, BinaryIO, Final
 
 import pandas as pd
+from openpyxl import load_workbook
 
+from clients.ai_utils.ai_utils_client.cache_store import CacheStore
+from clients.core_lib.core_lib_client.file_lock import atomic_write
 from clients.core_lib.core_lib_client.logger_client import logger
-from clients.gdrive import GDriveClient
+from clients.gdrive import GDriveClient, get_gdrive_client
+from clients.gdrive.gdrive_client.client import SPREADSHEET_MIME_TYPE
+
+DEFAULT_CHUNK_ROWS: Final[int] = 50_000
+DEFAULT_DOWNLOAD_WORKERS: Final[int] = 8
+# Keys a get_many_spreadsheets spec dict may hold (the rest would reach pandas)
+SPEC_KEYS: Final[frozenset[str]] = frozenset(
+    {"file_id", "key", "sheet", "force_download", "usecols", "dtype", "nrows"}
+)
+# Leading bytes of every XLSX workbook (a ZIP archive)
+XLSX_MAGIC: Final[bytes] = b"PK\x03\x04"
+
+# A sheet title or 0-based position, several of them, or None for the first
+SheetSpec = str | int | list[str | int] | None
 
 
 class DataIngestorClient:
@@ -13,15 +45,40 @@ class DataIngestorClient:
     Ensures data integrity before loading into the pipeline.
     """
 
-    def __init__(self, gdrive_client: GDriveClient | None = None) -> None:
+    def __init__(
+        self,
+        gdrive_client: GDriveClient | None = None,
+        cache_store: CacheStore | None = None,
+        cache_parsed: bool | None = None,
+        memory_map: bool = False,
+    ) -> None:
         """
         Initializes the ingestor.
         Injects a GDriveClient to reuse authentication sessions.
 
         Args:
             gdrive_client: An instance of GDriveClient.
-            If None, a new one will be created.
+            If None, the process-wide shared client is reused.
+            cache_store: Managed cache used when no local path is given.
+            If None, a CacheStore with the environment defaults is created on
+            first use.
+            cache_parsed: Whether parsed DataFrames are kept in the cache
+            store as uncompressed Feather files (requires pyarrow), keyed by
+            the source file hash and the read options. None (the default)
+            enables it in store mode only, so plain local-path callers never
+            populate the cache directory. Local-path loads
+            (get_spreadsheet_data with a local_file_path) are therefore
+            parsed from scratch every time unless cache_parsed=True.
+            memory_map: If True, cached frames are memory-mapped instead of
+            read into memory: near-instant loads shared between processes,
+            but the returned frames are read-only.
         """
+        self._cache_store: CacheStore | None = cache_store
+        self.cache_parsed: bool | None = cache_parsed
+        self.memory_map: bool = memory_map
+        # Background revalidations in flight, one per cached target
+        self._refreshes: dict[str, threading.Thread] = {}
+        self._refresh_lock: threading.Lock = threading.Lock()
 
         if gdrive_client:
             self.gdrive = gdrive_client
@@ -30,29 +87,72 @@ class DataIngestorClient:
             creds_path: str = os.getenv(
                 "GOOGLE_CREDENTIALS_PATH", "data/credentials.json"
             )
-            # The client now requires at least the credentials_path
-            self.gdrive = GDriveClient(credentials_path=creds_path)
+            # One authorized client per credentials set, shared by every ingestor
+            self.gdrive = get_gdrive_client(credentials_path=creds_path)
+
+    @property
+    def cache_store(self) -> CacheStore:
+        """The managed, host-wide cache (created on first use)."""
+        if self._cache_store is None:
+            self._cache_store = CacheStore()
+        return self._cache_store
 
     def get_spreadsheet_data(
         self,
-        local_file_path: str,
+        local_file_path: str | None,
         file_id: str,
         min_file_size: int = 500,
         force_download: bool = False,
-    ) -> pd.DataFrame:
+        sheet: SheetSpec = None,
+        revalidate: bool = False,
+        stale_while_revalidate: bool = False,
+        usecols: Any = None,
+        dtype: Any = None,
+        nrows: int | None = None,
+    ) -> pd.DataFrame | dict[str | int, pd.DataFrame]:
         """
         Retrieves spreadsheet data from a local cache or downloads it from GDrive.
         Automatically handles Google Sheets to Excel export conversion.
+        A '.csv' target stores native Google Sheets through the per-sheet CSV
+        export, which loads an order of magnitude faster than XLSX.
+
+        With local_file_path=None the managed cache store is used instead:
+        entries are keyed by file ID + Drive checksum/version, so a changed
+        source is always re-downloaded and unchanged ones are shared by every
+        job on the host.
 
         Args:
-            local_file_path: Target path on the local filesystem.
+            local_file_path: Target path on the local filesystem, or None to
+                use the managed cache store.
             file_id: Unique Google Drive file identifier.
             min_file_size: Minimum threshold in bytes to consider a file valid.
             force_download: If True, invalidates cache and triggers a new download.
+            sheet: Sheet title or 0-based position. Defaults to the first sheet.
+                A list reads several sheets of a workbook in a single pass and
+                returns a dict of DataFrames keyed by the given names.
+            revalidate: If True, an existing file is checked against the Drive
+                version (one metadata call) and re-downloaded only if the
+                source changed. The store always revalidates.
+            stale_while_revalidate: If True, cached data is returned at once
+                and the revalidation runs in a background thread; the next
+                call sees the refreshed copy.
+            usecols: Columns to parse (names, positions or Excel letters such
+                as "A:E" or "A,C:E"); the others are never materialized.
+                Letters also work for CSV sources, as column positions.
+            dtype: Column dtypes applied by the parser (e.g. {"id": "int32"}).
+            nrows: Number of data rows to read.
 
         Returns:
-            pd.DataFrame: The loaded dataset ready for processing.
+            pd.DataFrame | Dict[str | int, pd.DataFrame]: The loaded dataset
+            ready for processing (one frame per sheet when 'sheet' is a list).
         """
+        # Forwarded to the parser and part of the parsed-frame cache key
+        options: dict[str, Any] = {"usecols": usecols, "dtype": dtype, "nrows": nrows}
+
+        if local_file_path is None:
+            return self._load_from_store(
+                file_id, sheet, force_download, stale_while_revalidate, options
+            )
 
         file_exists: bool = os.path.exists(local_file_path)
         is_corrupted: bool = False
@@ -75,18 +175,666 @@ class DataIngestorClient:
                 os.remove(local_file_path)
             file_exists = False
 
-        # 3. Data Acquisition Phase
+        # 3. Revalidation
+        # One metadata call decides whether the existing file is still current
+        if file_exists and stale_while_revalidate:
+            self._refresh_in_background(
+                local_file_path,
+                self._revalidate_local,
+                local_file_path,
+                file_id,
+                sheet,
+            )
+        elif file_exists and revalidate:
+            self._revalidate_local(local_file_path, file_id, sheet)
+
+        # 4. Data Acquisition Phase
         # Downloads from GDrive only if the local cache is empty or invalidated
         if not file_exists:
             logger.info(
                 f">>> Resource missing or invalidated. Ingesting (ID: {file_id})..."
             )
-            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-            self.gdrive.download_file(file_id=file_id, local_path=local_file_path)
+            self._download_local(local_file_path, file_id, sheet)
         else:
             logger.info(f">>> File found: using existing file at {local_file_path}")
 
-        # 4. Data Loading
-        # We use 'openpyxl' as it is the standard for modern .xlsx files
-        # exported by GDrive
-        return pd.read_excel(local_file_path, engine="openpyxl")
+        # 5. Data Loading
+        # The content picks the parser: a '.csv' target may hold a binary
+        # workbook. CSV goes through the pandas C parser; for modern .xlsx
+        # files exported by GDrive we use 'openpyxl', the standard engine
+        with open(local_file_path, "rb") as fh:
+            suffix: str = _content_suffix(fh, local_file_path)
+            return self._parse(
+                fh, suffix, sheet, options, cache=self.cache_parsed is True
+            )
+
+    def fetch_spreadsheet_data(
+        self, file_id: str, sheet: str | int | None = None
+    ) -> pd.DataFrame:
+        """
+        Downloads and parses a spreadsheet entirely in memory.
+        Skips the local cache and the disk round trip, which pays off on
+        nodes where ephemeral disk I/O is the bottleneck. Native Google
+        Sheets are exported as CSV (one sheet) instead of XLSX.
+
+        Args:
+            file_id: Unique Google Drive file identifier.
+            sheet: Sheet title or 0-based position. Defaults to the first sheet.
+
+        Returns:
+            pd.DataFrame: The loaded dataset ready for processing.
+        """
+        logger.info(f">>> Streaming spreadsheet into memory (ID: {file_id})...")
+        if self._is_native_sheet(file_id):
+            return pd.read_csv(self.gdrive.export_sheet_csv(file_id, sheet))
+
+        buffer = self.gdrive.download_to_buffer(file_id)
+        return pd.read_excel(buffer, engine="openpyxl", sheet_name=sheet or 0)
+
+    def iter_spreadsheet_chunks(
+        self,
+        file_id: str,
+        chunksize: int = DEFAULT_CHUNK_ROWS,
+        sheet: str | int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams a spreadsheet as DataFrames of at most 'chunksize' rows.
+
+        The file goes through the managed cache store (on disk), then rows
+        are read incrementally: CSV through the pandas chunked reader, XLSX
+        through openpyxl's read-only mode. Peak memory is set by the chunk
+        size instead of the sheet size. Dtypes are inferred per chunk.
+
+        Args:
+            file_id: Unique Google Drive file identifier.
+            chunksize: Maximum number of rows per yielded DataFrame.
+            sheet: Sheet title or 0-based position. Defaults to the first sheet.
+
+        Yields:
+            pd.DataFrame: Consecutive row blocks sharing the header row.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive number of rows")
+
+        handle, suffix = self._cache_current(file_id, sheet)
+        with handle:
+            if suffix == ".csv":
+                with pd.read_csv(handle, chunksize=chunksize) as reader:
+                    yield from reader
+            else:
+                yield from _iter_xlsx_chunks(handle, chunksize, sheet)
+
+    def get_many_spreadsheets(
+        self,
+        specs: Iterable[str | dict[str, Any]],
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        parse_workers: int | None = None,
+    ) -> tuple[dict[str, pd.DataFrame | dict[str | int, pd.DataFrame]], dict[str, str]]:
+        """
+        Loads many spreadsheets concurrently and collects the results.
+
+        See iter_many_spreadsheets for the pipeline and the spec format.
+
+        Returns:
+            Tuple[Dict[str, DataFrame], Dict[str, str]]: The parsed data per
+            spec key (a dict of frames for multi-sheet specs), and the error
+            message per key that failed to load.
+        """
+        frames: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for key, data in self.iter_many_spreadsheets(
+            specs, download_workers, parse_workers
+        ):
+            if isinstance(data, Exception):
+                errors[key] = str(data)
+            else:
+                frames[key] = data
+        return frames, errors
+
+    def iter_many_spreadsheets(
+        self,
+        specs: Iterable[str | dict[str, Any]],
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        parse_workers: int | None = None,
+    ) -> Iterator[tuple[str, pd.DataFrame | dict[str | int, pd.DataFrame] | Exception]]:
+        """
+        Loads many spreadsheets through the managed cache store concurrently,
+        yielding each one as soon as it is ready.
+
+        Downloads run in a thread pool while XLSX/CSV parsing, which is
+        CPU-bound, runs in a process pool: while one file is parsed the next
+        ones are already being fetched. The pool is only started once a file
+        actually needs parsing, so a fully cached batch never spawns it. A
+        spec that fails (download, parse) yields its exception; the other
+        specs still load.
+
+        Args:
+            specs: File IDs, or dicts with a 'file_id' plus any of SPEC_KEYS:
+                'sheet', 'usecols', 'dtype', 'nrows', 'force_download' and
+                'key' (the result key, defaults to the file ID).
+            download_workers: Concurrent downloads (threads).
+            parse_workers: Parsing processes. Defaults to the CPU count; 0
+                parses in the download threads instead.
+
+        Yields:
+            Tuple[str, DataFrame | Exception]: (key, data) pairs in completion
+            order, with the raised exception as data for a failed spec.
+
+        Raises:
+            ValueError: If a spec has no 'file_id' or an unknown key (checked
+                before anything is loaded).
+        """
+        normalized: list[dict[str, Any]] = [_normalize_spec(spec) for spec in specs]
+        return self._iter_many(normalized, download_workers, parse_workers)
+
+    def wait_for_refreshes(self, timeout: float | None = None) -> None:
+        """
+        Blocks until the background revalidations started so far have finished.
+
+        Args:
+            timeout: Maximum seconds to wait for each refresh.
+        """
+        with self._refresh_lock:
+            threads: list[threading.Thread] = list(self._refreshes.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    # --- Local path mode ---
+
+    def _download_local(
+        self,
+        local_file_path: str,
+        file_id: str,
+        sheet: str | int | None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Downloads to a temporary sibling and renames it into place, then
+        records the source version next to the file for later revalidation.
+        Readers never observe a half-written file.
+        """
+        metadata = metadata or self.gdrive.get_file_metadata(file_id)
+        target_dir: str = os.path.dirname(local_file_path) or "."
+        os.makedirs(target_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".", suffix=".part")
+        os.close(fd)
+        try:
+            native: bool = metadata.get("mimeType") == SPREADSHEET_MIME_TYPE
+            if _is_csv(local_file_path) and native:
+                if isinstance(sheet, list):
+                    raise ValueError(
+                        "A '.csv' target holds one sheet; pass a single sheet"
+                    )
+                with open(tmp_path, "wb") as fh:
+                    fh.write(self.gdrive.export_sheet_csv(file_id, sheet).getbuffer())
+            else:
+                self.gdrive.download_file(file_id=file_id, local_path=tmp_path)
+            os.replace(tmp_path, local_file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        atomic_write(_version_path(local_file_path), _content_version(metadata))
+
+    def _revalidate_local(
+        self, local_file_path: str, file_id: str, sheet: str | int | None
+    ) -> bool:
+        """
+        Re-downloads 'local_file_path' only if the Drive version changed.
+
+        Returns:
+            bool: True if the file was refreshed.
+        """
+        metadata: dict[str, Any] = self.gdrive.get_file_metadata(file_id)
+        try:
+            with open(_version_path(local_file_path)) as fh:
+                cached_version: str | None = fh.read()
+        except FileNotFoundError:
+            # Downloaded before versions were recorded: assume it is stale
+            cached_version = None
+
+        if cached_version == _content_version(metadata):
+            logger.info(f">>> Revalidated: {local_file_path} is up to date")
+            return False
+
+        logger.info(f">>> Source changed. Refreshing {local_file_path}...")
+        self._download_local(local_file_path, file_id, sheet, metadata)
+        return True
+
+    def _iter_many(
+        self,
+        specs: list[dict[str, Any]],
+        download_workers: int,
+        parse_workers: int | None,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Runs the download/parse pipeline, yielding results as they finish.
+
+        A failed spec yields its exception in place of the data.
+        """
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+
+        # Started by the first parse miss; cache hits never pay for the spawn
+        parse_pool: ProcessPoolExecutor | None = None
+        pool_lock: threading.Lock = threading.Lock()
+
+        def _read_in_pool(
+            fh: BinaryIO, suffix: str, sheet: SheetSpec, options: dict[str, Any]
+        ) -> Any:
+            nonlocal parse_pool
+            with pool_lock:
+                if parse_pool is None:
+                    # 'spawn' keeps the children free of this process' threads
+                    # and locks
+                    parse_pool = ProcessPoolExecutor(
+                        parse_workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                pool: ProcessPoolExecutor = parse_pool
+            # The worker gets the bytes, not the entry path: eviction may
+            # unlink the entry once this thread's handle is the only pin.
+            # The download thread waits here; other threads keep downloading
+            data: bytes = fh.read()
+            return pool.submit(_read_bytes, data, suffix, sheet, options).result()
+
+        reader: Callable[..., Any] | None = _read_in_pool if parse_workers > 0 else None
+
+        def _load(spec: dict[str, Any]) -> tuple[str, Any]:
+            spec = dict(spec)
+            key: str = spec.pop("key", spec["file_id"])
+            file_id: str = spec.pop("file_id")
+            sheet: SheetSpec = spec.pop("sheet", None)
+            force_download: bool = spec.pop("force_download", False)
+            try:
+                data: Any = self._load_from_store(
+                    file_id,
+                    sheet,
+                    force_download,
+                    options={"usecols": None, "dtype": None, "nrows": None, **spec},
+                    reader=reader,
+                )
+            except Exception as e:
+                # One bad file must not cost the rest of the batch
+                logger.error(f">>> Failed to load {key}: {e}")
+                return key, e
+            return key, data
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=download_workers, thread_name_prefix="ingest"
+            ) as downloads:
+                pending: set[Future[tuple[str, Any]]] = {
+                    downloads.submit(_load, spec) for spec in specs
+                }
+                try:
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                finally:
+                    # An abandoned stream drops what has not started
+                    for future in pending:
+                        future.cancel()
+        finally:
+            with pool_lock:
+                if parse_pool is not None:
+                    parse_pool.shutdown(cancel_futures=True)
+
+    # --- Store mode ---
+
+    def _load_from_store(
+        self,
+        file_id: str,
+        sheet: SheetSpec,
+        force_download: bool,
+        stale_while_revalidate: bool = False,
+        options: dict[str, Any] | None = None,
+        reader: Callable[..., Any] | None = None,
+    ) -> pd.DataFrame | dict[str | int, pd.DataFrame]:
+        """Loads a spreadsheet through the managed cache store."""
+        if isinstance(sheet, list):
+            metadata: dict[str, Any] = self.gdrive.get_file_metadata(file_id)
+            if metadata.get("mimeType") == SPREADSHEET_MIME_TYPE:
+                # The CSV export holds one sheet: each one is its own entry
+                return {
+                    s: self._load_from_store(
+                        file_id,
+                        s,
+                        force_download,
+                        stale_while_revalidate,
+                        options,
+                        reader,
+                    )
+                    for s in sheet
+                }
+
+        if stale_while_revalidate and not force_download:
+            # Serve the newest stored version; bring the store up to date later
+            key: str | None = self.cache_store.latest(
+                file_id=file_id, native=True, sheet=sheet
+            ) or self.cache_store.latest(file_id=file_id, native=False)
+            stale: BinaryIO | None = self.cache_store.open(key) if key else None
+            if stale is not None:
+                self._refresh_in_background(
+                    f"store:{file_id}:{sheet}",
+                    lambda: self._cache_current(file_id, sheet)[0].close(),
+                )
+                with stale:
+                    return self._parse(
+                        stale, os.path.splitext(stale.name)[1], sheet, options, reader
+                    )
+
+        handle, suffix = self._cache_current(file_id, sheet, force_download)
+        with handle:
+            return self._parse(handle, suffix, sheet, options, reader)
+
+    def _cache_current(
+        self, file_id: str, sheet: str | int | None, force_download: bool = False
+    ) -> tuple[BinaryIO, str]:
+        """
+        Makes sure the store holds the current version of a spreadsheet.
+
+        Returns:
+            Tuple[BinaryIO, str]: An open handle on the entry and its suffix.
+        """
+        # 1. One metadata call identifies the current content version
+        metadata: dict[str, Any] = self.gdrive.get_file_metadata(file_id)
+        native: bool = metadata.get("mimeType") == SPREADSHEET_MIME_TYPE
+        version: str = _content_version(metadata)
+
+        # 2. Native Sheets are cached one sheet per entry, as CSV
+        key: str = CacheStore.make_key(file_id, version, sheet if native else None)
+        suffix: str = (
+            ".csv"
+            if native
+            else os.path.splitext(metadata.get("name", ""))[1].lower() or ".xlsx"
+        )
+        if force_download:
+            self.cache_store.discard(key)
+
+        def _download(path: str) -> None:
+            logger.info(f">>> Cache miss. Ingesting (ID: {file_id})...")
+            if native:
+                with open(path, "wb") as fh:
+                    fh.write(self.gdrive.export_sheet_csv(file_id, sheet).getbuffer())
+            else:
+                self.gdrive.download_file(file_id=file_id, local_path=path)
+
+        # 3. Hit or download; native entries also record their sheet
+        entry_metadata: dict[str, Any] = {
+            "file_id": file_id,
+            "name": metadata.get("name"),
+            "version": version,
+            "native": native,
+        }
+        if native:
+            entry_metadata["sheet"] = sheet
+        handle: BinaryIO = self.cache_store.fetch(
+            key, _download, suffix=suffix, metadata=entry_metadata
+        )
+        return handle, suffix
+
+    # --- Parsing ---
+
+    def _parse(
+        self,
+        fh: BinaryIO,
+        suffix: str,
+        sheet: SheetSpec,
+        options: dict[str, Any] | None = None,
+        reader: Callable[..., Any] | None = None,
+        cache: bool | None = None,
+    ) -> pd.DataFrame | dict[str | int, pd.DataFrame]:
+        """
+        Parses a downloaded spreadsheet, reusing an earlier parse when possible.
+
+        The parsed frame is cached as an uncompressed Feather file keyed by
+        the SHA-256 of the source bytes and the read options, so repeated
+        loads skip openpyxl entirely. Hits are read into ordinary, writable
+        frames (memory-mapped and read-only with memory_map=True). Frames
+        Arrow cannot represent (e.g. mixed-type object columns) are simply
+        not cached. With several sheets, each is cached on its own and the
+        missing ones are parsed together in one workbook pass.
+
+        'cache' defaults to the store-mode setting (cache_parsed not False).
+
+        Raises:
+            ValueError: If several sheets are requested from a CSV source.
+        """
+        if suffix == ".csv" and isinstance(sheet, list):
+            raise ValueError("A CSV source holds one sheet; pass a single sheet")
+        options = options or {}
+        # 'reader' lets batch loads hand the parse to a process pool
+        read: Callable[..., Any] = reader or _read_frame
+        if cache is None:
+            cache = self.cache_parsed is not False
+        # A callable usecols has no stable identity to key the cache on
+        if not cache or callable(options.get("usecols")):
+            return read(fh, suffix, sheet, options)
+
+        # 1. Identify each parse by source content and read options
+        digest: str = hashlib.file_digest(fh, "sha256").hexdigest()
+        fh.seek(0)
+        sheets: list[Any] = sheet if isinstance(sheet, list) else [sheet]
+        keys: dict[Any, str] = {
+            s: CacheStore.make_key("parsed", digest, suffix, s, options) for s in sheets
+        }
+
+        # 2. Hits: load the columnar copies instead of parsing
+        frames: dict[Any, pd.DataFrame] = {}
+        for s, key in keys.items():
+            cached: BinaryIO | None = self.cache_store.open(key)
+            if cached is None:
+                continue
+            with cached:
+                frame: pd.DataFrame | None = _read_feather(cached, self.memory_map)
+            if frame is not None:
+                frames[s] = frame
+
+        # 3. Misses: parse, then store the results for the next caller
+        missing: list[Any] = [s for s in sheets if s not in frames]
+        if missing:
+            parsed: Any = read(
+                fh, suffix, missing if isinstance(sheet, list) else sheet, options
+            )
+            parsed = parsed if isinstance(sheet, list) else {sheet: parsed}
+            for s, df in parsed.items():
+                frames[s] = df
+                self._store_parsed(keys[s], df, digest)
+
+        if isinstance(sheet, list):
+            return {s: frames[s] for s in sheets}
+        return frames[sheet]
+
+    def _store_parsed(self, key: str, df: pd.DataFrame, digest: str) -> None:
+        """Writes a parsed frame to the store as Feather, if Arrow can hold it."""
+        try:
+            self.cache_store.fetch(
+                key,
+                lambda path: df.to_feather(path, compression="uncompressed"),
+                suffix=".feather",
+                metadata={"parsed_from": digest},
+            ).close()
+        except (ImportError, ValueError, TypeError) as e:
+            logger.info(f">>> Parsed frame not cached ({type(e).__name__}: {e})")
+
+    # --- Helpers ---
+
+    def _refresh_in_background(
+        self, target: str, refresh: Callable[..., Any], *args: Any
+    ) -> None:
+        """Runs 'refresh' in a daemon thread, at most one at a time per target."""
+        with self._refresh_lock:
+            running: threading.Thread | None = self._refreshes.get(target)
+            if running is not None and running.is_alive():
+                return
+
+            def _run() -> None:
+                try:
+                    refresh(*args)
+                except Exception as e:
+                    # The stale copy stays in place; the next call tries again
+                    logger.warning(f"Background refresh of {target} failed: {e}")
+
+            thread: threading.Thread = threading.Thread(
+                target=_run, name=f"revalidate:{target}", daemon=True
+            )
+            self._refreshes[target] = thread
+            thread.start()
+
+    def _is_native_sheet(self, file_id: str) -> bool:
+        """True if the file is a Google Sheet (eligible for the CSV export)."""
+        return self.gdrive.get_mime_type(file_id) == SPREADSHEET_MIME_TYPE
+
+
+def _is_csv(path: str) -> bool:
+    return path.lower().endswith(".csv")
+
+
+def _content_suffix(fh: BinaryIO, path: str) -> str:
+    """
+    Returns the parser suffix for a downloaded file from its leading bytes.
+
+    Raises:
+        ValueError: If a target not named '.csv' does not hold an XLSX workbook.
+    """
+    is_workbook: bool = fh.read(len(XLSX_MAGIC)) == XLSX_MAGIC
+    fh.seek(0)
+    if is_workbook:
+        return ".xlsx"
+    if _is_csv(path):
+        return ".csv"
+    raise ValueError(
+        f"{path} does not hold an XLSX workbook; use a '.csv' target for CSV sources"
+    )
+
+
+def _version_path(local_file_path: str) -> str:
+    return f"{local_file_path}.version"
+
+
+def _content_version(metadata: dict[str, Any]) -> str:
+    """md5Checksum for binary files; Google Sheets only carry modifiedTime/version."""
+    return metadata.get("md5Checksum") or (
+        f"{metadata.get('modifiedTime')}:{metadata.get('version')}"
+    )
+
+
+def _read_feather(fh: BinaryIO, memory_map: bool = False) -> pd.DataFrame | None:
+    """
+    Loads a Feather file; None when pyarrow is unavailable.
+
+    By default the table is read into memory and converted with pandas'
+    consolidated blocks, which allocates fresh writable arrays. With
+    'memory_map' the columns stay zero-copy views of a read-only mapping.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:
+        return None
+
+    if not memory_map:
+        return feather.read_table(fh).to_pandas(split_blocks=False)
+
+    # Mapping the open descriptor is immune to a concurrent eviction unlinking it
+    mapped: mmap.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    table: pa.Table = feather.read_table(pa.BufferReader(pa.py_buffer(mapped)))
+    return table.to_pandas(split_blocks=True)
+
+
+def _iter_xlsx_chunks(
+    fh: BinaryIO, chunksize: int, sheet: str | int | None
+) -> Iterator[pd.DataFrame]:
+    """Reads one worksheet row by row (openpyxl read-only mode)."""
+    workbook = load_workbook(fh, read_only=True, data_only=True)
+    try:
+        worksheet = (
+            workbook[sheet]
+            if isinstance(sheet, str)
+            else workbook.worksheets[sheet or 0]
+        )
+        # Blank rows are skipped, as pd.read_excel does
+        rows: Iterator[tuple[Any, ...]] = (
+            row
+            for row in worksheet.iter_rows(values_only=True)
+            if any(cell is not None for cell in row)
+        )
+        header: tuple[Any, ...] = next(rows, ())
+        columns: list[Any] = [
+            name if name is not None else f"Unnamed: {i}"
+            for i, name in enumerate(header)
+        ]
+
+        while batch := list(islice(rows, chunksize)):
+            yield pd.DataFrame.from_records(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _normalize_spec(spec: str | dict[str, Any]) -> dict[str, Any]:
+    """Turns a batch spec into a dict, rejecting keys the loader does not know."""
+    if isinstance(spec, str):
+        return {"file_id": spec}
+    unknown: set[str] = set(spec) - SPEC_KEYS
+    if unknown:
+        raise ValueError(
+            f"Unknown spec keys {sorted(unknown)}; expected {sorted(SPEC_KEYS)}"
+        )
+    if "file_id" not in spec:
+        raise ValueError(f"Spec {spec!r} has no 'file_id'")
+    return dict(spec)
+
+
+def _read_bytes(
+    data: bytes, suffix: str, sheet: SheetSpec, options: dict[str, Any]
+) -> Any:
+    """Process-pool entry point: parses the content of a cached file."""
+    return _read_frame(io.BytesIO(data), suffix, sheet, options)
+
+
+def _column_positions(letters: str) -> list[int]:
+    """
+    Converts Excel column letters ("A:C,E") to 0-based positions ([0, 1, 2, 4]).
+
+    Raises:
+        ValueError: If 'letters' is not a comma-separated list of letters or
+            letter ranges.
+    """
+
+    def _position(label: str) -> int:
+        label = label.strip().upper()
+        if not label.isascii() or not label.isalpha():
+            raise ValueError(
+                f"usecols={letters!r} is not a list of Excel column letters "
+                "(e.g. 'A:E' or 'A,C:E')"
+            )
+        position: int = 0
+        for char in label:
+            position = position * 26 + ord(char) - ord("A") + 1
+        return position - 1
+
+    positions: list[int] = []
+    for part in letters.split(","):
+        first, _, last = part.partition(":")
+        start: int = _position(first)
+        positions.extend(range(start, (_position(last) if last else start) + 1))
+    return positions
+
+
+def _read_frame(
+    fh: BinaryIO,
+    suffix: str,
+    sheet: SheetSpec,
+    options: dict[str, Any] | None = None,
+) -> Any:
+    """Parses a CSV or XLSX file; a list of sheets yields a dict of frames."""
+    options = options or {}
+    if suffix == ".csv":
+        if isinstance(options.get("usecols"), str):
+            # read_csv has no Excel letters: translate them to positions
+            options = {**options, "usecols": _column_positions(options["usecols"])}
+        return pd.read_csv(fh, **options)
+    return pd.read_excel(
+        fh, engine="openpyxl", sheet_name=0 if sheet is None else sheet, **options
+    )
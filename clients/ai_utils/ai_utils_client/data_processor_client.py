@@ -1,9 +1,24 @@
 # automation-hub/ai_utils_client/data_processor_client.py
 import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Final
 
+import numpy as np
 import pandas as pd
 
-from clients.gdrive import GDriveClient
+from clients.ai_utils.ai_utils_client.categorical_encoder import CategoricalEncoder
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+    from clients.gdrive import GDriveClient
+
+
+# Spellings treated as booleans by optimize_dtypes (compared lower-cased).
+# Digits and single letters are left out: "0"/"1" or "Y"/"N" text columns are
+# often IDs or codes whose representation must survive.
+TRUE_STRINGS: Final[frozenset[str]] = frozenset({"true", "yes"})
+FALSE_STRINGS: Final[frozenset[str]] = frozenset({"false", "no"})
 
 
 class DataProcessorClient:
@@ -14,7 +29,7 @@ class DataProcessorClient:
     ensuring consistency across different AI and Data Science projects.
     """
 
-    def __init__(self, gdrive_client: GDriveClient | None = None) -> None:
+    def __init__(self, gdrive_client: "GDriveClient | None" = None) -> None:
         """
         Initializes the DataProcessorClient.
         Currently stateless, but prepared for future global configurations.
@@ -24,8 +39,14 @@ class DataProcessorClient:
         pass
 
     def encode_categorical_features(
-        self, df: pd.DataFrame, columns: list[str], drop_first: bool = True
-    ) -> pd.DataFrame:
+        self,
+        df: pd.DataFrame,
+        columns: list[str],
+        drop_first: bool = True,
+        encoder: CategoricalEncoder | None = None,
+        output: str = "bool",
+        max_levels: int | None = None,
+    ) -> "pd.DataFrame | sparse.csr_matrix":
         """
         Encodes categorical features using One-Hot Encoding (Dummy Encoding).
 
@@ -34,18 +55,122 @@ class DataProcessorClient:
             columns (List[str]): A list of column names to be encoded.
             drop_first (bool): Whether to get k-1 dummies out of k categorical levels
                              to prevent multicollinearity. Defaults to True.
+            encoder (Optional[CategoricalEncoder]): A fitted encoder (see
+                fit_categorical_encoder). When given, its columns and layout
+                are used, so every chunk gets the same dummy columns.
+            output (str): "bool" (default), "uint8", "sparse" (pandas sparse
+                columns) or "csr" (a scipy CSR matrix holding only the dummies).
+            max_levels (Optional[int]): Dummies kept per column; rarer levels
+                are folded into an "other" bucket (the dropped level when
+                drop_first is set).
 
         Returns:
-            pd.DataFrame: A new DataFrame with transformed categorical features.
+            pd.DataFrame | sparse.csr_matrix: A new DataFrame with transformed
+            categorical features, or the dummy matrix for output="csr" (with
+            no columns if none of 'columns' is in the frame).
         """
+        if encoder is not None:
+            return encoder.transform(df)
+
         # Filter columns that actually exist in the DataFrame to prevent errors
         existing_cols: list[str] = [col for col in columns if col in df.columns]
 
         if not existing_cols:
             logging.warning("No matching columns found for encoding.")
+            if output == "csr":
+                from scipy import sparse
+
+                # Same type as any other csr result: a matrix with no dummies
+                return sparse.csr_matrix((len(df), 0), dtype=np.uint8)
             return df
 
-        return pd.get_dummies(df, columns=existing_cols, drop_first=drop_first)
+        if output == "bool" and max_levels is None:
+            return pd.get_dummies(df, columns=existing_cols, drop_first=drop_first)
+
+        # Compact outputs and level caps go through a one-off fitted encoder
+        return CategoricalEncoder(
+            existing_cols, drop_first=drop_first, max_levels=max_levels, output=output
+        ).fit_transform(df)
+
+    def fit_categorical_encoder(
+        self,
+        data: pd.DataFrame | Iterable[pd.DataFrame],
+        columns: list[str],
+        drop_first: bool = True,
+        max_levels: int | None = None,
+        output: str = "bool",
+    ) -> CategoricalEncoder:
+        """
+        Learns the category vocabularies used for consistent One-Hot Encoding.
+
+        Args:
+            data (pd.DataFrame | Iterable[pd.DataFrame]): Training data, or
+                chunks consumed in a single streaming pass.
+            columns (List[str]): A list of column names to be encoded.
+            drop_first (bool): Whether to drop the first level of each column.
+            max_levels (Optional[int]): Dummies kept per column; rarer levels
+                are folded into an "other" bucket (the dropped level when
+                drop_first is set).
+            output (str): Representation produced by transform (see
+                encode_categorical_features).
+
+        Returns:
+            CategoricalEncoder: A fitted, joblib-serializable encoder to pass
+            to encode_categorical_features (or use directly).
+        """
+        return CategoricalEncoder(
+            columns, drop_first=drop_first, max_levels=max_levels, output=output
+        ).fit(data)
+
+    def optimize_dtypes(
+        self, df: pd.DataFrame, categorical_threshold: float = 0.5
+    ) -> tuple[pd.DataFrame, dict[str, Any]]:
+        """
+        Shrinks a DataFrame's memory footprint without changing its values.
+
+        Integers are downcast to the smallest width holding their range,
+        floats to float32 only where every value survives the round trip,
+        text columns holding only "yes"/"no" or "true"/"false" (any case)
+        become booleans and low-cardinality text columns become 'category'.
+        Duplicate column names are handled position by position.
+
+        Args:
+            df (pd.DataFrame): The input pandas DataFrame (left untouched).
+            categorical_threshold (float): Maximum ratio of unique values to
+                rows for a text column to be converted to 'category'.
+
+        Returns:
+            Tuple[pd.DataFrame, Dict[str, Any]]: The optimized copy and a
+            report with 'before_bytes', 'after_bytes', 'saved_pct' and the
+            dtype change of every converted column.
+        """
+        before: int = int(df.memory_usage(deep=True).sum())
+        optimized: pd.DataFrame = df.copy(deep=False)
+        changes: dict[str, dict[str, str]] = {}
+
+        # By position: with duplicate names df[column] would be a DataFrame
+        for position, column in enumerate(df.columns):
+            original: pd.Series = df.iloc[:, position]
+            converted: pd.Series = _optimize_series(original, categorical_threshold)
+            if converted.dtype != original.dtype:
+                optimized.isetitem(position, converted)
+                changes[str(column)] = {
+                    "before": str(original.dtype),
+                    "after": str(converted.dtype),
+                }
+
+        after: int = int(optimized.memory_usage(deep=True).sum())
+        report: dict[str, Any] = {
+            "before_bytes": before,
+            "after_bytes": after,
+            "saved_pct": round(100 * (1 - after / before), 2) if before else 0.0,
+            "columns": changes,
+        }
+        logging.info(
+            f"optimize_dtypes: {before:,} -> {after:,} bytes "
+            f"({report['saved_pct']}% saved, {len(changes)} columns converted)"
+        )
+        return optimized, report
 
     def handle_missing_values(
         self, df: pd.DataFrame, strategy: str = "drop"
@@ -60,3 +185,47 @@ class DataProcessorClient:
         if strategy == "drop":
             return df.dropna()
         return df
+
+
+def _optimize_series(series: pd.Series, categorical_threshold: float) -> pd.Series:
+    """Returns 'series' in its most compact lossless dtype (or unchanged)."""
+    # 1. Integers: unsigned when nothing is negative
+    if pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        unsigned: bool = bool(series.min() >= 0) if series.notna().any() else False
+        return pd.to_numeric(series, downcast="unsigned" if unsigned else "integer")
+
+    # 2. Floats: float32 only if every value round-trips exactly
+    if pd.api.types.is_float_dtype(series):
+        values: np.ndarray = series.to_numpy(dtype="float64", na_value=np.nan)
+        with np.errstate(over="ignore"):
+            # Values beyond the float32 range overflow to inf and fail the check
+            narrow: np.ndarray = values.astype("float32")
+            if np.array_equal(narrow.astype("float64"), values, equal_nan=True):
+                return series.astype("float32")
+        return series
+
+    # 3. Text: booleans first, then low-cardinality categoricals
+    if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+        non_null: pd.Series = series.dropna()
+        if non_null.empty:
+            return series
+
+        try:
+            unique: np.ndarray = non_null.unique()
+        except TypeError:
+            # Unhashable cells (lists, dicts) fit neither bool nor category
+            return series
+        if len(unique) <= len(TRUE_STRINGS | FALSE_STRINGS):
+            lowered: set[str] = {str(v).strip().lower() for v in unique}
+            if lowered <= TRUE_STRINGS | FALSE_STRINGS:
+                flags: pd.Series = non_null.map(
+                    lambda v: str(v).strip().lower() in TRUE_STRINGS
+                )
+                if len(non_null) == len(series):
+                    return flags.astype(bool)
+                return flags.reindex(series.index).astype("boolean")
+
+        if len(unique) / len(series) <= categorical_threshold:
+            return series.astype("category")
+
+    return series
@@ -0,0 +1,113 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client import data_ingestor_client
+from clients.ai_utils.ai_utils_client.cache_store import CacheStore
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> dict[str, Path]:
+    """'f<i>' is an XLSX whose 'value' column holds i."""
+    files: dict[str, Path] = {}
+    for i in range(4):
+        files[f"f{i}"] = tmp_path / f"f{i}.xlsx"
+        pd.DataFrame({"value": [i], "extra": ["x"]}).to_excel(
+            files[f"f{i}"], index=False
+        )
+    return files
+
+
+@pytest.fixture
+def ingestor(
+    files: dict[str, Path], make_ingestor: Callable[..., DataIngestorClient]
+) -> DataIngestorClient:
+    return make_ingestor(files)
+
+
+@pytest.mark.unit
+def test_get_many_parses_in_worker_processes(ingestor: DataIngestorClient) -> None:
+    """Every spec comes back under its key, parsed with its own read options."""
+    results, errors = ingestor.get_many_spreadsheets(
+        ["f0", "f1", {"file_id": "f2", "key": "two", "usecols": ["value"]}],
+        download_workers=3,
+        parse_workers=2,
+    )
+
+    assert errors == {}
+    assert set(results) == {"f0", "f1", "two"}
+    assert results["f1"]["value"].tolist() == [1]
+    assert list(results["two"].columns) == ["value"]
+
+
+@pytest.mark.unit
+def test_get_many_streams_in_completion_order(ingestor: DataIngestorClient) -> None:
+    """iter_many_spreadsheets yields (key, frame) pairs as each file is ready."""
+    stream: Any = ingestor.iter_many_spreadsheets(
+        [f"f{i}" for i in range(4)], download_workers=2, parse_workers=0
+    )
+
+    values: dict[str, int] = {key: df["value"].iat[0] for key, df in stream}
+
+    assert values == {f"f{i}": i for i in range(4)}
+
+
+@pytest.mark.unit
+def test_get_many_reports_failures_per_spec(
+    files: dict[str, Path],
+    make_ingestor: Callable[..., DataIngestorClient],
+    tmp_path: Path,
+) -> None:
+    """A bad spec is reported under its key; eviction never breaks a parse."""
+    # A one-byte budget evicts every other entry as soon as a new one lands
+    ingestor: DataIngestorClient = make_ingestor(
+        files, cache_store=CacheStore(str(tmp_path / "tiny"), max_bytes=1)
+    )
+
+    results, errors = ingestor.get_many_spreadsheets(
+        [*(f"f{i}" for i in range(4)), "missing"],
+        download_workers=4,
+        parse_workers=2,
+    )
+
+    assert {key: df["value"].iat[0] for key, df in results.items()} == {
+        f"f{i}": i for i in range(4)
+    }
+    assert list(errors) == ["missing"]
+
+
+@pytest.mark.unit
+def test_fully_cached_batch_never_starts_the_process_pool(
+    ingestor: DataIngestorClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Parsed-frame hits skip the parse, so no worker process is spawned."""
+    pytest.importorskip("pyarrow")
+    specs: list[str] = [f"f{i}" for i in range(4)]
+    ingestor.get_many_spreadsheets(specs, parse_workers=0)
+    pools: list[Any] = []
+    monkeypatch.setattr(
+        data_ingestor_client,
+        "ProcessPoolExecutor",
+        lambda *args, **kwargs: pools.append(args),
+    )
+
+    results, errors = ingestor.get_many_spreadsheets(specs, parse_workers=2)
+
+    assert errors == {}
+    assert len(results) == 4
+    assert pools == []
+
+
+@pytest.mark.unit
+def test_unknown_spec_keys_are_rejected_up_front(
+    ingestor: DataIngestorClient,
+) -> None:
+    """A typo in a spec fails before any download instead of reaching pandas."""
+    with pytest.raises(ValueError, match="Unknown spec keys"):
+        ingestor.iter_many_spreadsheets(["f0", {"file_id": "f1", "use_cols": ["a"]}])
+
+    ingestor.gdrive.download_file.assert_not_called()
@@ -0,0 +1,77 @@
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from clients.ai_utils.ai_utils_client.cache_store import CacheStore
+
+
+def _writer(content: bytes, calls: list[str] | None = None) -> Callable[[str], None]:
+    def _download(path: str) -> None:
+        if calls is not None:
+            calls.append(path)
+        time.sleep(0.01)
+        Path(path).write_bytes(content)
+
+    return _download
+
+
+@pytest.mark.unit
+def test_fetch_downloads_once_and_hits_afterwards(tmp_path: Path) -> None:
+    """Concurrent fetches of one missing key download it a single time."""
+    store: CacheStore = CacheStore(str(tmp_path), max_bytes=1_000)
+    key: str = CacheStore.make_key("file", "md5-v1")
+    calls: list[str] = []
+    contents: list[bytes] = []
+
+    def _fetch() -> None:
+        with store.fetch(key, _writer(b"payload", calls), suffix=".csv") as fh:
+            contents.append(fh.read())
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=_fetch) for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert contents == [b"payload"] * 5
+    assert store.stats()["entries"] == 1
+    assert not list(tmp_path.glob(".*.part"))
+
+
+@pytest.mark.unit
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """Going over the byte budget evicts the entry read longest ago."""
+    store: CacheStore = CacheStore(str(tmp_path), max_bytes=25)
+    for name in ("a", "b"):
+        store.fetch(name, _writer(b"x" * 10)).close()
+        time.sleep(0.01)
+
+    # Touch 'a' so 'b' becomes the least recently used entry
+    handle = store.open("a")
+    assert handle is not None
+    handle.close()
+    store.fetch("c", _writer(b"y" * 10)).close()
+
+    assert store.entry("b") is None
+    assert store.entry("a") is not None
+    assert store.stats()["bytes"] == 20
+
+
+@pytest.mark.unit
+def test_discard_forces_a_new_download(tmp_path: Path) -> None:
+    """A discarded entry is downloaded again on the next fetch."""
+    store: CacheStore = CacheStore(str(tmp_path))
+    calls: list[str] = []
+
+    store.fetch("k", _writer(b"v1", calls)).close()
+    store.discard("k")
+    with store.fetch("k", _writer(b"v2", calls)) as fh:
+        assert fh.read() == b"v2"
+
+    assert len(calls) == 2
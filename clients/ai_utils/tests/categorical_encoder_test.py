@@ -0,0 +1,154 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+from clients.ai_utils import CategoricalEncoder, DataProcessorClient
+
+TRAIN: pd.DataFrame = pd.DataFrame(
+    {
+        "color": ["red", "green", "blue", "green", None, "red"],
+        "size": ["S", "M", "L", "M", "S", "XL"],
+        "price": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    }
+)
+
+
+@pytest.mark.unit
+def test_chunks_share_one_layout_matching_get_dummies() -> None:
+    """Streaming partial fits reproduce pd.get_dummies on the whole frame."""
+    processor: DataProcessorClient = DataProcessorClient()
+    chunks: list[pd.DataFrame] = [TRAIN.iloc[:2], TRAIN.iloc[2:4], TRAIN.iloc[4:]]
+    encoder: CategoricalEncoder = processor.fit_categorical_encoder(
+        iter(chunks), ["color", "size"]
+    )
+
+    encoded: list[pd.DataFrame] = [
+        processor.encode_categorical_features(c, [], encoder=encoder) for c in chunks
+    ]
+
+    expected: pd.DataFrame = pd.get_dummies(
+        TRAIN, columns=["color", "size"], drop_first=True
+    )
+    assert all(list(e.columns) == list(expected.columns) for e in encoded)
+    pd.testing.assert_frame_equal(pd.concat(encoded), expected)
+
+
+@pytest.mark.unit
+def test_unseen_levels_encode_as_zeros(tmp_path: Path) -> None:
+    """A reloaded encoder keeps its layout; new levels get no dummy."""
+    encoder: CategoricalEncoder = CategoricalEncoder(["color"], drop_first=False)
+    encoder.fit(TRAIN).save(str(tmp_path / "encoder.joblib"))
+    restored: CategoricalEncoder = CategoricalEncoder.load(
+        str(tmp_path / "encoder.joblib")
+    )
+
+    out: pd.DataFrame = restored.transform(
+        pd.DataFrame({"color": ["purple", "red"], "price": [1.0, 2.0]})
+    )
+
+    assert restored.feature_names_ == ["color_blue", "color_green", "color_red"]
+    assert out[restored.feature_names_].sum(axis=1).tolist() == [0, 1]
+
+    with pytest.raises(ValueError, match="missing"):
+        restored.transform(pd.DataFrame({"price": [1.0]}))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("output", ["uint8", "sparse", "csr"])
+def test_compact_outputs_hold_the_same_dummies(output: str) -> None:
+    """Every output mode encodes the same cells as the default bool frame."""
+    processor: DataProcessorClient = DataProcessorClient()
+    reference: pd.DataFrame = processor.encode_categorical_features(
+        TRAIN, ["color", "size"]
+    )
+    dummy_columns: list[str] = [c for c in reference.columns if c != "price"]
+
+    encoded = processor.encode_categorical_features(
+        TRAIN, ["color", "size"], output=output
+    )
+
+    if output == "csr":
+        assert isinstance(encoded, sparse.csr_matrix)
+        assert encoded.dtype == np.uint8
+        dense: np.ndarray = encoded.toarray()
+    else:
+        assert list(encoded.columns) == list(reference.columns)
+        assert isinstance(encoded["size_S"].dtype, pd.SparseDtype) == (
+            output == "sparse"
+        )
+        dense = encoded[dummy_columns].to_numpy(dtype=np.uint8)
+    np.testing.assert_array_equal(dense, reference[dummy_columns].to_numpy())
+
+
+@pytest.mark.unit
+def test_max_levels_folds_rare_levels_into_other() -> None:
+    """Only the most frequent levels keep a dummy; the rest share 'other'."""
+    df: pd.DataFrame = pd.DataFrame({"city": ["a"] * 5 + ["b"] * 3 + ["c", "d"]})
+    encoder: CategoricalEncoder = CategoricalEncoder(
+        ["city"], drop_first=False, max_levels=2, output="uint8"
+    ).fit(df)
+
+    out: pd.DataFrame = encoder.transform(pd.DataFrame({"city": ["c", "zzz", "a"]}))
+
+    assert encoder.feature_names_ == ["city_a", "city_b", "city_other"]
+    assert out.to_numpy().tolist() == [[0, 0, 1], [0, 0, 1], [1, 0, 0]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("output", ["bool", "uint8", "sparse"])
+def test_categorical_dtype_order_matches_get_dummies(output: str) -> None:
+    """Levels follow the dtype's categories, as pd.get_dummies orders them."""
+    grade: pd.CategoricalDtype = pd.CategoricalDtype(["lo", "mid", "hi"], ordered=True)
+    df: pd.DataFrame = pd.DataFrame(
+        {"g": pd.Series(["hi", "lo", "mid", "hi"], dtype=grade)}
+    )
+
+    encoded: pd.DataFrame = CategoricalEncoder(["g"], output=output).fit_transform(df)
+
+    expected: pd.DataFrame = pd.get_dummies(df, columns=["g"], drop_first=True)
+    assert list(encoded.columns) == ["g_mid", "g_hi"] == list(expected.columns)
+    np.testing.assert_array_equal(
+        encoded.to_numpy(dtype=np.uint8), expected.to_numpy(dtype=np.uint8)
+    )
+
+
+@pytest.mark.unit
+def test_real_level_named_like_the_bucket_is_folded_into_it() -> None:
+    """A frequent 'other' level shares the bucket instead of duplicating it."""
+    df: pd.DataFrame = pd.DataFrame({"g": ["other"] * 3 + ["a"] * 2 + ["b", "c"]})
+    encoder: CategoricalEncoder = CategoricalEncoder(
+        ["g"], drop_first=False, max_levels=2, output="uint8"
+    ).fit(df)
+
+    out: pd.DataFrame = encoder.transform(pd.DataFrame({"g": ["other", "c", "a"]}))
+
+    assert encoder.feature_names_ == ["g_a", "g_b", "g_other"]
+    assert out.to_numpy().tolist() == [[0, 0, 1], [0, 0, 1], [1, 0, 0]]
+
+
+@pytest.mark.unit
+def test_capped_columns_drop_the_other_bucket() -> None:
+    """With drop_first, the bucket is the reference; frequent levels all stay."""
+    df: pd.DataFrame = pd.DataFrame({"city": ["a"] * 5 + ["b"] * 3 + ["c", "d"]})
+    encoder: CategoricalEncoder = CategoricalEncoder(
+        ["city"], max_levels=2, output="uint8"
+    ).fit(df)
+
+    out: pd.DataFrame = encoder.transform(pd.DataFrame({"city": ["a", "b", "zzz"]}))
+
+    assert encoder.feature_names_ == ["city_a", "city_b"]
+    assert out.to_numpy().tolist() == [[1, 0], [0, 1], [0, 0]]
+
+
+@pytest.mark.unit
+def test_csr_output_is_a_matrix_even_without_matching_columns() -> None:
+    """output="csr" never falls back to returning the frame."""
+    encoded = DataProcessorClient().encode_categorical_features(
+        TRAIN, ["missing"], output="csr"
+    )
+
+    assert isinstance(encoded, sparse.csr_matrix)
+    assert encoded.shape == (len(TRAIN), 0)
@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+FRAME: pd.DataFrame = pd.DataFrame(
+    {"id": range(10), "label": [f"row-{i}" for i in range(10)]}
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("suffix", [".xlsx", ".csv"])
+def test_chunks_are_bounded_and_complete(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient], suffix: str
+) -> None:
+    """Every row arrives exactly once, in blocks of at most 'chunksize' rows."""
+    source: Path = tmp_path / f"data{suffix}"
+    if suffix == ".csv":
+        FRAME.to_csv(source, index=False)
+    else:
+        with pd.ExcelWriter(source) as writer:
+            pd.DataFrame({"x": [0]}).to_excel(writer, sheet_name="Other", index=False)
+            FRAME.to_excel(writer, sheet_name="Data", index=False)
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+
+    chunks: list[pd.DataFrame] = list(
+        ingestor.iter_spreadsheet_chunks(
+            "fid", chunksize=4, sheet="Data" if suffix == ".xlsx" else None
+        )
+    )
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), FRAME, check_dtype=False
+    )
@@ -0,0 +1,42 @@
+import hashlib
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.ai_utils.ai_utils_client.cache_store import CacheStore
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+
+@pytest.fixture
+def make_ingestor(tmp_path: Path) -> Callable[..., DataIngestorClient]:
+    """
+    Builds ingestors whose Drive serves local files.
+
+    The factory takes a {file_id: path} map (plus DataIngestorClient keyword
+    arguments); metadata reports each file's name and md5, and downloads copy
+    the file. Unless one is given, every ingestor shares one CacheStore
+    under tmp_path.
+    """
+
+    def _make(files: dict[str, Path], **kwargs: Any) -> DataIngestorClient:
+        gdrive: MagicMock = MagicMock()
+        gdrive.get_file_metadata.side_effect = lambda file_id: {
+            "name": files[file_id].name,
+            "mimeType": "application/octet-stream",
+            "md5Checksum": hashlib.md5(
+                files[file_id].read_bytes(), usedforsecurity=False
+            ).hexdigest(),
+        }
+
+        def _download(file_id: str, local_path: str) -> Any:
+            return shutil.copyfile(files[file_id], local_path)
+
+        gdrive.download_file.side_effect = _download
+        kwargs.setdefault("cache_store", CacheStore(str(tmp_path / "store")))
+        return DataIngestorClient(gdrive_client=gdrive, **kwargs)
+
+    return _make
@@ -0,0 +1,90 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client.data_processor_client import DataProcessorClient
+
+
+@pytest.mark.unit
+def test_optimize_dtypes_shrinks_without_changing_values() -> None:
+    """Each column lands in its most compact lossless dtype."""
+    rows: int = 1_000
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "small_int": np.arange(rows) % 100,
+            "signed": np.arange(rows) - 500,
+            "exact_float": np.full(rows, 0.5),
+            "precise_float": np.full(rows, 0.1),
+            "flag": np.where(np.arange(rows) % 2, "Yes", "no").astype(object),
+            "country": np.array(["PT", "ES", "FR", "DE"] * (rows // 4), dtype=object),
+            "free_text": [f"note {i}" for i in range(rows)],
+        }
+    )
+
+    optimized, report = DataProcessorClient().optimize_dtypes(df)
+    dtypes: dict[str, Any] = optimized.dtypes.astype(str).to_dict()
+
+    assert dtypes == {
+        "small_int": "uint8",
+        "signed": "int16",
+        "exact_float": "float32",
+        "precise_float": "float64",
+        "flag": "bool",
+        "country": "category",
+        "free_text": str(df["free_text"].dtype),
+    }
+    assert optimized["flag"].sum() == rows // 2
+    assert (optimized["country"] == df["country"]).all()
+    assert report["after_bytes"] < report["before_bytes"] / 2
+    assert report["columns"]["small_int"]["before"] == "int64"
+    assert str(df["small_int"].dtype) == "int64"
+
+
+@pytest.mark.unit
+def test_optimize_dtypes_keeps_missing_values() -> None:
+    """Missing booleans use the nullable dtype; NaNs survive float checks."""
+    df: pd.DataFrame = pd.DataFrame(
+        {"flag": ["true", None, "FALSE"], "value": [1.5, np.nan, 2.0]}
+    )
+
+    optimized, _ = DataProcessorClient().optimize_dtypes(df)
+
+    assert str(optimized["flag"].dtype) == "boolean"
+    assert optimized["flag"].isna().tolist() == [False, True, False]
+    assert str(optimized["value"].dtype) == "float32"
+    assert np.isnan(optimized["value"].iat[1])
+
+
+@pytest.mark.unit
+@pytest.mark.filterwarnings("error")
+def test_optimize_dtypes_leaves_unsupported_columns_alone() -> None:
+    """Unhashable cells and floats beyond float32 range are kept as they are."""
+    df: pd.DataFrame = pd.DataFrame(
+        {"tags": [["a"], {"b": 1}, ["a"]], "huge": [1e300, 2.0, -1e300]}
+    )
+
+    optimized, _ = DataProcessorClient().optimize_dtypes(df)
+
+    assert optimized["tags"].tolist() == df["tags"].tolist()
+    assert optimized["tags"].dtype == object
+    assert optimized["huge"].dtype == "float64"
+
+
+@pytest.mark.unit
+def test_optimize_dtypes_keeps_coded_text_and_duplicate_names() -> None:
+    """Codes such as "0"/"1" stay text; repeated names are optimized one by one."""
+    df: pd.DataFrame = pd.DataFrame(
+        [["0", "yes", 1], ["1", "no", 2], ["1", "yes", 3]],
+        columns=["code", "flag", "flag"],
+    )
+
+    optimized, _ = DataProcessorClient().optimize_dtypes(df, categorical_threshold=0)
+
+    assert optimized["code"].tolist() == ["0", "1", "1"]
+    assert optimized.dtypes.astype(str).tolist() == [
+        str(df["code"].dtype),
+        "bool",
+        "uint8",
+    ]
@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+FRAME: pd.DataFrame = pd.DataFrame({"id": [1, 2], "label": ["a", "b"]})
+
+
+@pytest.mark.unit
+def test_binary_workbook_behind_a_csv_target_is_read_as_excel(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """The content, not the target extension, picks the parser."""
+    source: Path = tmp_path / "report.xlsx"
+    FRAME.to_excel(source, index=False)
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+
+    df: pd.DataFrame = ingestor.get_spreadsheet_data(
+        str(tmp_path / "raw" / "report.csv"), "fid", min_file_size=0
+    )
+
+    pd.testing.assert_frame_equal(df, FRAME)
+
+
+@pytest.mark.unit
+def test_csv_content_behind_a_workbook_target_fails_clearly(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """A non-'.csv' target must hold an XLSX workbook."""
+    source: Path = tmp_path / "report.csv"
+    FRAME.to_csv(source, index=False)
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+
+    with pytest.raises(ValueError, match="does not hold an XLSX workbook"):
+        ingestor.get_spreadsheet_data(
+            str(tmp_path / "raw" / "report.xlsx"), "fid", min_file_size=0
+        )
@@ -0,0 +1,165 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client import data_ingestor_client
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    """Records every real spreadsheet parse."""
+    calls: list[Any] = []
+    original = data_ingestor_client._read_frame
+
+    def _counting(*args: Any) -> pd.DataFrame:
+        calls.append(args[1:])
+        return original(*args)
+
+    monkeypatch.setattr(data_ingestor_client, "_read_frame", _counting)
+    return calls
+
+
+@pytest.mark.unit
+def test_unchanged_workbook_is_parsed_once(
+    tmp_path: Path, parses: list[Any], make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """Hits load the Feather copy; another sheet is a separate parse."""
+    path: Path = tmp_path / "data.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_excel(writer, index=False)
+        pd.DataFrame({"c": [3.5]}).to_excel(writer, sheet_name="Other", index=False)
+    ingestor: DataIngestorClient = make_ingestor({}, cache_parsed=True)
+
+    first: pd.DataFrame = ingestor.get_spreadsheet_data(str(path), "fid", 0)
+    second: pd.DataFrame = ingestor.get_spreadsheet_data(str(path), "fid", 0)
+    other: pd.DataFrame = ingestor.get_spreadsheet_data(
+        str(path), "fid", 0, sheet="Other"
+    )
+
+    pd.testing.assert_frame_equal(first, second)
+    assert other["c"].tolist() == [3.5]
+    assert len(parses) == 2
+
+
+@pytest.mark.unit
+def test_frames_arrow_cannot_store_are_returned_uncached(
+    tmp_path: Path, parses: list[Any], make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """A mixed-type column cannot be written as Feather: parse, never fail."""
+    path: Path = tmp_path / "mixed.xlsx"
+    pd.DataFrame({"a": [1, "x", 2.5]}).to_excel(path, index=False)
+    ingestor: DataIngestorClient = make_ingestor({}, cache_parsed=True)
+
+    for _ in range(2):
+        df: pd.DataFrame = ingestor.get_spreadsheet_data(str(path), "fid", 0)
+        assert df["a"].tolist() == [1, "x", 2.5]
+
+    assert len(parses) == 2
+    assert ingestor.cache_store.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_read_options_reach_the_parser_and_the_key(
+    tmp_path: Path, parses: list[Any], make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """Projection/dtypes shape the frame; several sheets are parsed in one pass."""
+    path: Path = tmp_path / "wide.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.1] * 3}).to_excel(
+            writer, sheet_name="First", index=False
+        )
+        pd.DataFrame({"a": [9], "b": ["w"], "c": [0.2]}).to_excel(
+            writer, sheet_name="Second", index=False
+        )
+    ingestor: DataIngestorClient = make_ingestor({}, cache_parsed=True)
+    options: dict[str, Any] = {"usecols": ["a", "c"], "dtype": {"a": "int16"}}
+
+    narrow: pd.DataFrame = ingestor.get_spreadsheet_data(
+        str(path), "fid", 0, nrows=2, **options
+    )
+    both: dict[Any, pd.DataFrame] = ingestor.get_spreadsheet_data(
+        str(path), "fid", 0, sheet=["First", "Second"], **options
+    )
+    ingestor.get_spreadsheet_data(str(path), "fid", 0, sheet=["Second"], **options)
+
+    assert list(narrow.columns) == ["a", "c"]
+    assert narrow["a"].dtype == "int16"
+    assert len(narrow) == 2
+    assert list(both) == ["First", "Second"]
+    assert both["Second"]["a"].tolist() == [9]
+    # nrows=2 is a different parse; the two sheets share one; 'Second' is a hit
+    assert [call[1] for call in parses] == [None, ["First", "Second"]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_cache_hits_are_writable_unless_memory_mapped(
+    tmp_path: Path, memory_map: bool, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """A hit behaves like a fresh parse; only the mmap opt-in is read-only."""
+    path: Path = tmp_path / "data.xlsx"
+    pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]}).to_excel(path, index=False)
+    ingestor: DataIngestorClient = make_ingestor(
+        {}, cache_parsed=True, memory_map=memory_map
+    )
+
+    ingestor.get_spreadsheet_data(str(path), "fid", 0)
+    hit: pd.DataFrame = ingestor.get_spreadsheet_data(str(path), "fid", 0)
+
+    if memory_map:
+        with pytest.raises(ValueError, match="read-only"):
+            hit.loc[0, "a"] = 99
+    else:
+        hit.loc[0, "a"] = 99
+        assert hit["a"].tolist() == [99, 2]
+
+
+@pytest.mark.unit
+def test_local_paths_skip_the_parsed_cache_by_default(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """Without an explicit opt-in, a local-path load never fills the store."""
+    path: Path = tmp_path / "data.xlsx"
+    pd.DataFrame({"a": [1]}).to_excel(path, index=False)
+    ingestor: DataIngestorClient = make_ingestor({})
+
+    ingestor.get_spreadsheet_data(str(path), "fid", 0)
+
+    assert ingestor.cache_store.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_excel_letters_select_csv_columns(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """usecols="A,C:D" works on CSV sources too; other strings fail clearly."""
+    path: Path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1], "b": [2], "c": [3], "d": [4]}).to_csv(path, index=False)
+    ingestor: DataIngestorClient = make_ingestor({}, cache_parsed=True)
+
+    df: pd.DataFrame = ingestor.get_spreadsheet_data(
+        str(path), "fid", 0, usecols="A,C:D"
+    )
+
+    assert list(df.columns) == ["a", "c", "d"]
+    with pytest.raises(ValueError, match="Excel column letters"):
+        ingestor.get_spreadsheet_data(str(path), "fid", 0, usecols="A-C")
+
+
+@pytest.mark.unit
+def test_sheet_lists_are_rejected_for_csv_sources(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """A binary CSV on Drive has no sheets: a list fails before any parse."""
+    source: Path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1]}).to_csv(source, index=False)
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+
+    with pytest.raises(ValueError, match="one sheet"):
+        ingestor.get_spreadsheet_data(None, "fid", sheet=["First", "Second"])
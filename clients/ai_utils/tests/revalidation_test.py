@@ -0,0 +1,78 @@
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from clients.ai_utils.ai_utils_client.data_ingestor_client import DataIngestorClient
+
+
+def _hold_downloads(ingestor: DataIngestorClient) -> threading.Event:
+    """Makes every download wait until the returned event is set."""
+    release: threading.Event = threading.Event()
+    release.set()
+    download: Any = ingestor.gdrive.download_file.side_effect
+
+    def _held(file_id: str, local_path: str) -> Any:
+        release.wait()
+        return download(file_id, local_path)
+
+    ingestor.gdrive.download_file.side_effect = _held
+    return release
+
+
+@pytest.mark.unit
+def test_revalidate_downloads_only_changed_sources(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient]
+) -> None:
+    """An unchanged source costs one metadata call; a changed one is re-fetched."""
+    source: Path = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+    path: str = str(tmp_path / "raw" / "data.csv")
+
+    ingestor.get_spreadsheet_data(path, "fid", min_file_size=0)
+    ingestor.get_spreadsheet_data(path, "fid", min_file_size=0, revalidate=True)
+    assert ingestor.gdrive.download_file.call_count == 1
+
+    source.write_text("a\n2\n")
+    df: pd.DataFrame = ingestor.get_spreadsheet_data(
+        path, "fid", min_file_size=0, revalidate=True
+    )
+
+    assert ingestor.gdrive.download_file.call_count == 2
+    assert df["a"].tolist() == [2]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_store", [False, True])
+def test_stale_while_revalidate_serves_cached_data(
+    tmp_path: Path, make_ingestor: Callable[..., DataIngestorClient], use_store: bool
+) -> None:
+    """Stale data is returned at once; the refresh lands in the background."""
+    source: Path = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    ingestor: DataIngestorClient = make_ingestor({"fid": source})
+    release: threading.Event = _hold_downloads(ingestor)
+    path: str | None = None if use_store else str(tmp_path / "raw" / "data.csv")
+    ingestor.get_spreadsheet_data(path, "fid", min_file_size=0)
+
+    # Hold the refresh download until the stale result has been returned
+    source.write_text("a\n2\n")
+    release.clear()
+    stale: pd.DataFrame = ingestor.get_spreadsheet_data(
+        path, "fid", min_file_size=0, stale_while_revalidate=True
+    )
+    release.set()
+    ingestor.wait_for_refreshes(timeout=5)
+
+    fresh: pd.DataFrame = ingestor.get_spreadsheet_data(
+        path, "fid", min_file_size=0, stale_while_revalidate=True
+    )
+    ingestor.wait_for_refreshes(timeout=5)
+
+    assert stale["a"].tolist() == [1]
+    assert fresh["a"].tolist() == [2]
+    assert ingestor.gdrive.download_file.call_count == 2
@@ -1,3 +1,13 @@
-from .core_lib_client.logger_client import (
-    Logger as Logger,
+from typing import TYPE_CHECKING
+
+from .core_lib_client.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .core_lib_client.logger_client import Logger as Logger
+
+__all__: list[str] = ["Logger"]
+
+# Promoted names are imported on first access (see lazy_exports)
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"Logger": ".core_lib_client.logger_client"}
 )
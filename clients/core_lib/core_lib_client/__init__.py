@@ -1 +1,10 @@
-from .logger_client import Logger as Logger
+from typing import TYPE_CHECKING
+
+from .lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .logger_client import Logger as Logger
+
+__all__: list[str] = ["Logger"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"Logger": ".logger_client"})
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Serializes threads of this process; flock only arbitrates between processes
+_thread_locks: dict[str, threading.Lock] = {}
+_registry_lock: threading.Lock = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock tied to 'path' across threads and processes.
+
+    The lock lives in a '<path>.lock' sidecar, so the protected file itself
+    can be replaced atomically while the lock is held. On platforms without
+    fcntl only threads of the current process are serialized.
+
+    Args:
+        path (str): The file to protect.
+    """
+    lock_path: str = f"{os.path.abspath(path)}.lock"
+    with _registry_lock:
+        thread_lock: threading.Lock = _thread_locks.setdefault(
+            lock_path, threading.Lock()
+        )
+
+    with thread_lock:
+        Path(lock_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: str, data: str) -> None:
+    """
+    Replaces a text file atomically: readers see the old or the new content,
+    never a partial write.
+
+    Args:
+        path (str): Destination file.
+        data (str): Full new content.
+    """
+    directory: Path = Path(path).parent
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
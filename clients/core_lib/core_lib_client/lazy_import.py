@@ -0,0 +1,37 @@
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Builds a module-level __getattr__ / __dir__ pair for promoted names.
+
+    Each name is imported from its defining module on first access and then
+    stored in the package namespace, so later lookups are plain attribute
+    reads. Importing the package itself stays as cheap as its __init__.
+
+    Args:
+        package (str): The package's __name__.
+        exports (Dict[str, str]): Promoted name -> module path (relative
+            paths are resolved against 'package').
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ functions.
+    """
+    namespace: dict[str, Any] = vars(import_module(package))
+
+    def __getattr__(name: str) -> Any:
+        module_path: str | None = exports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value: Any = getattr(import_module(module_path, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
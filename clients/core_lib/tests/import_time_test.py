@@ -0,0 +1,65 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[3]
+
+# Cold-import budgets in milliseconds (cumulative, as reported by -X importtime)
+IMPORT_BUDGETS_MS: Final[dict[str, float]] = {
+    "clients.core_lib": 50.0,
+    "clients.gdrive": 50.0,
+    "clients.ai_utils": 50.0,
+}
+# Heavy dependencies that must only load once a promoted client is used
+HEAVY_MODULES: Final[tuple[str, ...]] = ("pandas", "googleapiclient", "scipy", "joblib")
+
+
+def _cold_import(module: str) -> tuple[float, set[str]]:
+    """Imports 'module' in a fresh interpreter; returns (ms, heavy modules loaded)."""
+    code: str = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = re.search(
+        rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$",
+        result.stderr,
+        re.MULTILINE,
+    )
+    assert match, f"No importtime entry for {module}"
+    loaded: set[str] = set(filter(None, result.stdout.strip().split(",")))
+    return int(match.group(1)) / 1000, loaded
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS_MS))
+def test_cold_import_within_budget(module: str) -> None:
+    """Importing a client package stays cheap and defers its heavy dependencies."""
+    elapsed_ms, loaded = _cold_import(module)
+
+    assert not loaded, f"{module} eagerly imports {sorted(loaded)}"
+    assert elapsed_ms <= IMPORT_BUDGETS_MS[module], (
+        f"{module} took {elapsed_ms:.1f} ms (budget {IMPORT_BUDGETS_MS[module]} ms)"
+    )
+
+
+@pytest.mark.unit
+def test_promoted_names_resolve_on_access() -> None:
+    """Lazy exports still resolve to the real classes and show up in dir()."""
+    import clients.gdrive as gdrive
+    from clients.gdrive.gdrive_client.client import GDriveClient
+
+    assert "GDriveClient" in dir(gdrive)
+    assert gdrive.GDriveClient is GDriveClient
+    with pytest.raises(AttributeError):
+        _ = gdrive.NotAClient
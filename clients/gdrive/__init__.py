@@ -1 +1,30 @@
-from .gdrive_client.client import GDriveClient as GDriveClient
+from typing import TYPE_CHECKING
+
+from clients.core_lib.core_lib_client.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .gdrive_client.async_client import AsyncGDriveClient as AsyncGDriveClient
+    from .gdrive_client.client import GDriveClient as GDriveClient
+    from .gdrive_client.registry import (
+        clear_gdrive_clients as clear_gdrive_clients,
+        get_gdrive_client as get_gdrive_client,
+    )
+
+__all__: list[str] = [
+    "AsyncGDriveClient",
+    "GDriveClient",
+    "clear_gdrive_clients",
+    "get_gdrive_client",
+]
+
+# Promoted names are imported on first access, so 'import clients.gdrive'
+# does not pay for googleapiclient until a client is actually used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncGDriveClient": ".gdrive_client.async_client",
+        "GDriveClient": ".gdrive_client.client",
+        "clear_gdrive_clients": ".gdrive_client.registry",
+        "get_gdrive_client": ".gdrive_client.registry",
+    },
+)
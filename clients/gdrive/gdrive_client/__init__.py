@@ -1,3 +1,28 @@
-from .client import GDriveClient
+from typing import TYPE_CHECKING
 
-__all__: list[str] = ["GDriveClient"]
+from clients.core_lib.core_lib_client.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_client import AsyncGDriveClient as AsyncGDriveClient
+    from .client import GDriveClient as GDriveClient
+    from .registry import (
+        clear_gdrive_clients as clear_gdrive_clients,
+        get_gdrive_client as get_gdrive_client,
+    )
+
+__all__: list[str] = [
+    "AsyncGDriveClient",
+    "GDriveClient",
+    "clear_gdrive_clients",
+    "get_gdrive_client",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncGDriveClient": ".async_client",
+        "GDriveClient": ".client",
+        "clear_gdrive_clients": ".registry",
+        "get_gdrive_client": ".registry",
+    },
+)
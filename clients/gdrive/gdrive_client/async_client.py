@@ -0,0 +1,239 @@
+import asyncio
+import functools
+import os
+import tempfile
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Final
+
+from googleapiclient.http import MediaIoBaseDownload
+
+from clients.core_lib.core_lib_client.logger_client import logger
+from clients.gdrive.gdrive_client.client import (
+    LIST_PAGE_SIZE,
+    STREAM_CHUNK_SIZE,
+    UPLOAD_CHUNK_SIZE,
+    GDriveClient,
+)
+from clients.gdrive.gdrive_client.registry import get_gdrive_client
+
+# Default number of Drive operations allowed in flight at once
+DEFAULT_CONCURRENCY: Final[int] = 16
+
+
+class AsyncGDriveClient:
+    """
+    Asyncio facade over GDriveClient for event-loop based orchestrators.
+
+    googleapiclient only offers blocking calls, so every operation runs on a
+    bounded worker pool shared by the whole client (never a thread per call),
+    gated by a semaphore that caps how many Drive operations are in flight.
+    Transfers are driven one chunk per await: cancelling a task stops it at
+    the next chunk boundary, discards partial downloads and leaves uploads
+    resumable.
+    """
+
+    def __init__(
+        self,
+        client: GDriveClient | None = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """
+        Args:
+            client (Optional[GDriveClient]): Synchronous client to wrap.
+                If None, the shared client for the environment defaults is used.
+            max_concurrency (int): Maximum Drive operations running at once.
+        """
+        self.client: GDriveClient = client or get_gdrive_client()
+        self.max_concurrency: int = max_concurrency
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="gdrive-async"
+        )
+
+    async def __aenter__(self) -> "AsyncGDriveClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stops the worker pool, dropping operations that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a blocking call on the worker pool once a concurrency slot is free."""
+        async with self._semaphore:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+
+    # --- Queries ---
+
+    async def file_exists(self, file_name: str, folder_id: str) -> bool:
+        """Coroutine version of GDriveClient.file_exists."""
+        return await self._run(self.client.file_exists, file_name, folder_id)
+
+    async def list_files(
+        self, folder_id: str | None = None, limit: int = 10
+    ) -> list[dict[str, str]]:
+        """Coroutine version of GDriveClient.list_files."""
+        return await self._run(self.client.list_files, folder_id, limit)
+
+    async def iter_files(
+        self,
+        query: str,
+        fields: str = "id, name",
+        page_size: int = LIST_PAGE_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Async generator version of GDriveClient.iter_files.
+        Files are pulled from the worker pool one page at a time.
+        """
+        files: Iterator[dict[str, Any]] = self.client.iter_files(
+            query, fields=fields, page_size=page_size
+        )
+        while True:
+            page: list[dict[str, Any]] = await self._run(_take, files, page_size)
+            if not page:
+                return
+            for f in page:
+                yield f
+
+    # --- Transfers ---
+
+    async def upload_file(
+        self,
+        file_path: str,
+        folder_id: str,
+        overwrite: bool = True,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> str:
+        """
+        Coroutine version of GDriveClient.upload_file.
+
+        Each resumable chunk is one awaited step; if the task is cancelled the
+        saved session lets a later call resume from the last committed chunk.
+        """
+        existing_id: str | None = None
+        if overwrite:
+            matches: list[dict[str, str]] = await self._run(
+                self.client._find_by_name, os.path.basename(file_path), folder_id
+            )
+            if matches:
+                existing_id = matches[0]["id"]
+
+        # The upload moves between pool threads, so it gets its own HTTP object
+        steps: Generator[int, None, str] = self.client._upload_steps(
+            file_path,
+            folder_id,
+            existing_id,
+            http=self.client._new_http(),
+            chunk_size=chunk_size,
+        )
+        while True:
+            done, value = await self._run(_advance, steps)
+            if done:
+                return value
+
+    async def download_file(
+        self,
+        file_id: str,
+        local_path: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        export_mime_type: str | None = None,
+    ) -> None:
+        """
+        Coroutine version of GDriveClient.download_file.
+
+        The file is written to a temporary sibling and renamed into place once
+        complete; a cancelled download leaves nothing behind.
+        """
+        request: Any = await self._run(
+            self._prepare_download, file_id, export_mime_type
+        )
+
+        target_dir: str = os.path.dirname(os.path.abspath(local_path))
+        os.makedirs(target_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                downloader: MediaIoBaseDownload = MediaIoBaseDownload(
+                    fh, request, chunksize=chunk_size
+                )
+                done: bool = False
+                while not done:
+                    _, done = await self._run(
+                        self.client.executor.call, downloader.next_chunk
+                    )
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.success(f"File successfully saved to: {local_path}")
+
+    async def download_to_buffer(
+        self, file_id: str, export_mime_type: str | None = None
+    ) -> Any:
+        """Coroutine version of GDriveClient.download_to_buffer."""
+        return await self._run(
+            self.client.download_to_buffer, file_id, export_mime_type=export_mime_type
+        )
+
+    async def export_sheet_csv(
+        self, file_id: str, sheet: str | int | None = None
+    ) -> Any:
+        """Coroutine version of GDriveClient.export_sheet_csv."""
+        return await self._run(self.client.export_sheet_csv, file_id, sheet)
+
+    def _prepare_download(
+        self, file_id: str, export_mime_type: str | None = None
+    ) -> Any:
+        """Builds a download request bound to a dedicated HTTP object."""
+        request: Any = self.client._media_request(
+            file_id, self.client.get_mime_type(file_id), export_mime_type
+        )
+        # The chunks run on different pool threads, so the thread-local HTTP
+        # object cannot be reused here
+        request.http = self.client._new_http()
+        return request
+
+    # --- Deletions ---
+
+    async def delete_specific_file(self, file_name: str, folder_id: str) -> bool:
+        """Coroutine version of GDriveClient.delete_specific_file."""
+        return await self._run(self.client.delete_specific_file, file_name, folder_id)
+
+    async def clear_folder_content(
+        self, folder_id: str, trash: bool = False
+    ) -> list[str]:
+        """Coroutine version of GDriveClient.clear_folder_content."""
+        return await self._run(self.client.clear_folder_content, folder_id, trash)
+
+    async def delete_files_by_prefix(
+        self, folder_id: str, file_prefix: str, trash: bool = False
+    ) -> list[str]:
+        """Coroutine version of GDriveClient.delete_files_by_prefix."""
+        return await self._run(
+            self.client.delete_files_by_prefix, folder_id, file_prefix, trash
+        )
+
+
+def _advance(steps: Generator[Any, None, Any]) -> tuple[bool, Any]:
+    """
+    Runs one step of a generator; returns (True, result) once it is exhausted.
+    StopIteration cannot cross a Future boundary, hence the tuple.
+    """
+    try:
+        return False, next(steps)
+    except StopIteration as finished:
+        return True, finished.value
+
+
+def _take(items: Iterator[Any], count: int) -> list[Any]:
+    """Pulls up to 'count' items from an iterator."""
+    return list(islice(items, count))
@@ -1,33 +1,204 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import threading
+from datetime import UTC, datetime
+from typing import Any, Final
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from clients.core_lib.core_lib_client.file_lock import atomic_write, file_lock
+from clients.core_lib.core_lib_client.logger_client import logger
+
+# Access tokens are renewed this many seconds before they expire
+REFRESH_MARGIN: Final[float] = 300.0
+# Delay before a failed background refresh is attempted again
+REFRESH_RETRY_DELAY: Final[float] = 30.0
+
+
+class CredentialManager:
+    """
+    Owns the OAuth credentials stored in one token file.
+
+    A single Credentials object is shared by the whole process and refreshed
+    in place shortly before it expires (by a background timer, so requests
+    do not pay the refresh latency). Refreshes and token writes happen under
+    a file lock; whoever waited for the lock first re-reads the token file
+    and adopts a token another process already refreshed, so N workers
+    starting together cause one refresh instead of N. The token file is
+    always replaced atomically.
+    """
+
+    def __init__(
+        self,
+        credentials_path: str,
+        token_path: str,
+        scopes: list[str],
+        refresh_margin: float = REFRESH_MARGIN,
+        background_refresh: bool = True,
+    ) -> None:
+        """
+        Args:
+            credentials_path (str): OAuth client secrets file.
+            token_path (str): Where the authorized token is stored.
+            scopes (List[str]): OAuth scopes requested.
+            refresh_margin (float): Seconds before expiry at which the token
+                is considered due for renewal.
+            background_refresh (bool): If True, a daemon timer renews the
+                token before it expires.
+        """
+        self.credentials_path: str = credentials_path
+        self.token_path: str = token_path
+        self.scopes: list[str] = scopes
+        self.refresh_margin: float = refresh_margin
+        self.background_refresh: bool = background_refresh
+
+        self._creds: Credentials | None = None
+        self._lock: threading.RLock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self.refreshes: int = 0
+
+    def get(self) -> Credentials:
+        """
+        Returns valid credentials, loading or renewing them only when needed.
+
+        Returns:
+            Credentials: The process-wide credentials for this token file.
+        """
+        creds: Credentials | None = self._creds
+        if creds is not None and not self._is_due(creds):
+            return creds
+
+        with self._lock:
+            if self._creds is None or self._is_due(self._creds):
+                self._renew(interactive=True)
+            return self._creds
+
+    def close(self) -> None:
+        """Stops the background refresh timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    # --- Internals ---
+
+    def _is_due(self, creds: Credentials) -> bool:
+        if not creds.valid:
+            return True
+        remaining: float | None = _seconds_left(creds)
+        return remaining is not None and remaining <= self.refresh_margin
+
+    def _renew(self, interactive: bool) -> None:
+        """Loads, refreshes or (if allowed) re-authorizes under the file lock."""
+        with file_lock(self.token_path):
+            # 1. Another process may have refreshed while we waited for the lock
+            on_disk: Credentials | None = self._read_token()
+            if on_disk is not None and not self._is_due(on_disk):
+                fresh: Credentials = on_disk
+            else:
+                # 2. Refresh our token (or the stored one) in place
+                current: Credentials | None = self._creds or on_disk
+                if current is not None and current.refresh_token:
+                    current.refresh(Request())
+                    fresh = current
+                elif interactive:
+                    # 3. No usable token at all: run the consent flow once
+                    flow: InstalledAppFlow = InstalledAppFlow.from_client_secrets_file(
+                        self.credentials_path, self.scopes
+                    )
+                    fresh = flow.run_local_server(port=0)
+                else:
+                    return
+
+                self.refreshes += 1
+                atomic_write(self.token_path, fresh.to_json())
+
+            self._install(fresh)
+
+        self._schedule()
+
+    def _install(self, fresh: Credentials) -> None:
+        if self._creds is None or fresh is self._creds:
+            self._creds = fresh
+            return
+        # Update the shared object so every HTTP client holding it sees the token
+        self._creds.token = fresh.token
+        self._creds.expiry = fresh.expiry
+
+    def _read_token(self) -> Credentials | None:
+        if not os.path.exists(self.token_path):
+            return None
+        try:
+            return Credentials.from_authorized_user_file(self.token_path, self.scopes)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable token file {self.token_path}: {e}")
+            return None
+
+    def _schedule(self, delay: float | None = None) -> None:
+        if not self.background_refresh or self._creds is None:
+            return
+        if delay is None:
+            remaining: float | None = _seconds_left(self._creds)
+            if remaining is None:
+                return
+            delay = max(remaining - self.refresh_margin, 1.0)
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._background_refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                self._renew(interactive=False)
+        except Exception as e:
+            logger.warning(
+                f"Background token refresh failed, retrying in "
+                f"{REFRESH_RETRY_DELAY:.0f}s: {e}"
+            )
+            self._schedule(REFRESH_RETRY_DELAY)
+
+
+_managers: dict[tuple[str, str, tuple[str, ...]], CredentialManager] = {}
+_managers_lock: threading.Lock = threading.Lock()
+
+
+def get_credential_manager(
+    credentials_path: str, token_path: str, scopes: list[str]
+) -> CredentialManager:
+    """Returns the process-wide CredentialManager of a token file and scope set."""
+    key: tuple[str, str, tuple[str, ...]] = (
+        os.path.abspath(credentials_path),
+        os.path.abspath(token_path),
+        tuple(sorted(scopes)),
+    )
+    with _managers_lock:
+        manager: CredentialManager | None = _managers.get(key)
+        if manager is None:
+            manager = CredentialManager(credentials_path, token_path, list(scopes))
+            _managers[key] = manager
+        return manager
+
 
 def get_google_service_credentials(
     credentials_path: str, token_path: str, scopes: list[str]
 ) -> Any:
     """
     Handles the OAuth2 flow and returns valid credentials.
+    Credentials are cached per token file and kept fresh by CredentialManager.
     """
-    creds: Credentials | None = None
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, scopes)
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow: InstalledAppFlow = InstalledAppFlow.from_client_secrets_file(
-                credentials_path, scopes
-            )
-            creds = flow.run_local_server(port=0)
+    return get_credential_manager(credentials_path, token_path, scopes).get()
 
-        with open(token_path, "w") as token:
-            token.write(creds.to_json())
 
-    return creds
+def _seconds_left(creds: Credentials) -> float | None:
+    if creds.expiry is None:
+        return None
+    # google-auth stores expiry as a naive UTC datetime
+    now: datetime = datetime.now(UTC).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds()
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Final
+
+# Name component reserved for cached folder listings (Drive names cannot hold NUL)
+_LISTING_PREFIX: Final[str] = "\x00list:"
+
+CacheKey = tuple[str, str]
+
+
+class MetadataCache:
+    """
+    Bounded LRU cache with a per-entry TTL for Drive metadata lookups.
+
+    Entries are keyed by (folder_id, file_name) and hold the list of matching
+    files; an empty list records a known miss. Folder listings are stored
+    under reserved keys of the same folder. The client writes its own
+    creations, updates and deletions through, so the cache never has to wait
+    for the TTL to notice changes made by this process.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of keys kept before the least
+                recently used one is evicted.
+            ttl (float): Seconds an entry stays valid after being stored.
+            clock (Callable[[], float]): Monotonic time source (injectable for tests).
+        """
+        self.max_entries: int = max_entries
+        self.ttl: float = ttl
+        self._clock: Callable[[], float] = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, list[dict[str, str]]]] = (
+            OrderedDict()
+        )
+        # Reverse index so deletions by ID do not need to scan every entry
+        self._keys_by_id: dict[str, set[CacheKey]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    # --- Lookups ---
+
+    def get(self, folder_id: str, file_name: str) -> list[dict[str, str]] | None:
+        """Returns the cached matches for a name, or None on a miss."""
+        return self._get((folder_id, file_name))
+
+    def get_listing(self, folder_id: str, limit: int) -> list[dict[str, str]] | None:
+        """Returns a cached folder listing, or None on a miss."""
+        return self._get((folder_id, f"{_LISTING_PREFIX}{limit}"))
+
+    # --- Population ---
+
+    def put(self, folder_id: str, file_name: str, files: list[dict[str, str]]) -> None:
+        """Stores the full set of files matching a name (empty = known absent)."""
+        with self._lock:
+            self._store((folder_id, file_name), files)
+
+    def put_listing(
+        self, folder_id: str, limit: int, files: list[dict[str, str]]
+    ) -> None:
+        """Stores a folder listing and primes the per-name entries it reveals."""
+        with self._lock:
+            self._store((folder_id, f"{_LISTING_PREFIX}{limit}"), files)
+
+            by_name: dict[str, list[dict[str, str]]] = {}
+            for f in files:
+                by_name.setdefault(f["name"], []).append(f)
+            for name, matches in by_name.items():
+                self._store((folder_id, name), matches)
+
+    # --- Write-through ---
+
+    def record_upload(self, folder_id: str, file_name: str, file_id: str) -> None:
+        """Registers a file created or updated by this process."""
+        key: CacheKey = (folder_id, file_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            files: list[dict[str, str]] = list(entry[1]) if entry else []
+            if all(f["id"] != file_id for f in files):
+                files.append({"id": file_id, "name": file_name})
+            self._store(key, files)
+            self._drop_listings(folder_id)
+
+    def discard_id(self, file_id: str) -> None:
+        """Removes a deleted file from every entry that references it."""
+        with self._lock:
+            for key in self._keys_by_id.pop(file_id, set()):
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if key[1].startswith(_LISTING_PREFIX):
+                    self._remove(key)
+                    continue
+                remaining = [f for f in entry[1] if f["id"] != file_id]
+                self._entries[key] = (entry[0], remaining)
+
+    def invalidate_folder(self, folder_id: str) -> None:
+        """Drops every entry belonging to a folder."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == folder_id]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Empties the cache, keeping the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: hits, misses, evictions, expirations, current size
+                and hit rate.
+        """
+        with self._lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    # --- Internals (caller must hold the lock) ---
+
+    def _get(self, key: CacheKey) -> list[dict[str, str]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, files = entry
+            if self._clock() - stored_at > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(files)
+
+    def _store(self, key: CacheKey, files: list[dict[str, str]]) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (self._clock(), list(files))
+        for f in files:
+            self._keys_by_id.setdefault(f["id"], set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest: CacheKey = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for f in entry[1]:
+            keys = self._keys_by_id.get(f["id"])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_id[f["id"]]
+
+    def _drop_listings(self, folder_id: str) -> None:
+        for key in [
+            k
+            for k in self._entries
+            if k[0] == folder_id and k[1].startswith(_LISTING_PREFIX)
+        ]:
+            self._remove(key)
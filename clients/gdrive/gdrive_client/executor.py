@@ -0,0 +1,320 @@
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Final
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from clients.core_lib.core_lib_client.logger_client import logger
+
+# Default process-wide request rate (override with GDRIVE_MAX_QPS, 0 disables).
+# Drive's default quota is 12,000 queries per minute per user (200/s); 150/s
+# keeps 25% headroom for other clients of the same account. Every inner call
+# of a batch costs one token, so a full 100-call batch drains ~0.7 s of budget
+# and clearing 20k files is bounded at ~2.5 minutes by the bucket.
+DEFAULT_MAX_QPS: Final[float] = 150.0
+DEFAULT_MAX_RETRIES: Final[int] = 6
+# Backoff bounds in seconds (full jitter between 0 and the exponential cap)
+BASE_DELAY: Final[float] = 1.0
+MAX_DELAY: Final[float] = 64.0
+
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+# 403 is only retryable when Drive reports one of these quota reasons
+RATE_LIMIT_REASONS: Final[frozenset[str]] = frozenset(
+    {"rateLimitExceeded", "userRateLimitExceeded"}
+)
+TRANSPORT_ERRORS: Final[tuple[type[Exception], ...]] = (
+    ConnectionError,
+    TimeoutError,
+    httplib2.HttpLib2Error,
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that caps the request rate.
+
+    Callers reserve tokens up front and sleep outside the lock until their
+    reservation is covered, so concurrent threads are served in arrival
+    order and bursts never exceed 'capacity' requests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            rate (float): Tokens added per second. A value <= 0 disables limiting.
+            capacity (Optional[float]): Maximum burst size. Defaults to 'rate'.
+            clock (Callable[[], float]): Monotonic time source (injectable for tests).
+            sleep (Callable[[float], None]): Sleep function (injectable for tests).
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._tokens: float = self.capacity
+        self._updated: float = clock()
+        self._lock: threading.Lock = threading.Lock()
+
+    def set_rate(self, rate: float, capacity: float | None = None) -> None:
+        """Changes the rate (and burst size) for every user of the bucket."""
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity if capacity is not None else max(rate, 1.0)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Blocks until 'tokens' requests may be sent.
+
+        Args:
+            tokens (float): Number of requests about to be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            if self.rate <= 0:
+                return 0.0
+            now: float = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            wait: float = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+_shared_bucket: TokenBucket | None = None
+_shared_lock: threading.Lock = threading.Lock()
+
+
+def shared_bucket() -> TokenBucket:
+    """
+    Returns the process-wide token bucket used by every GDriveClient.
+
+    The rate is read once from GDRIVE_MAX_QPS (default DEFAULT_MAX_QPS);
+    call set_rate() on the returned bucket to change it at runtime.
+    """
+    global _shared_bucket
+    with _shared_lock:
+        if _shared_bucket is None:
+            rate: float = float(os.getenv("GDRIVE_MAX_QPS", DEFAULT_MAX_QPS))
+            _shared_bucket = TokenBucket(rate)
+        return _shared_bucket
+
+
+class RequestExecutor:
+    """
+    Central path for every Drive API call.
+
+    Each call first takes tokens from a (by default process-wide) bucket,
+    then retries rate-limit responses, 5xx errors and transport failures
+    with exponential backoff and full jitter, honouring Retry-After when
+    Drive sends it. Counters of requests, retries, throttles and failures
+    are exposed through stats().
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            bucket (Optional[TokenBucket]): Rate limiter. Defaults to shared_bucket().
+            max_retries (int): Retries allowed per call before giving up.
+            base_delay (float): Backoff cap of the first retry, in seconds.
+            max_delay (float): Upper bound of any backoff, in seconds.
+            sleep (Callable[[float], None]): Sleep function (injectable for tests).
+        """
+        self.bucket: TokenBucket = bucket or shared_bucket()
+        self.max_retries: int = max_retries
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self._sleep: Callable[[float], None] = sleep
+        self._lock: threading.Lock = threading.Lock()
+
+        self.requests: int = 0
+        self.retries: int = 0
+        self.throttles: int = 0
+        self.failures: int = 0
+        self.throttled_seconds: float = 0.0
+
+    def call(
+        self, fn: Callable[..., Any], *args: Any, tokens: int = 1, **kwargs: Any
+    ) -> Any:
+        """
+        Runs a request-sending callable under the rate limit, retrying on
+        retryable errors.
+
+        Args:
+            fn (Callable): Sends the request (e.g. request.execute, next_chunk).
+            *args: Positional arguments for 'fn'.
+            tokens (int): Requests 'fn' sends (a batch counts every item).
+            **kwargs: Keyword arguments for 'fn'.
+
+        Returns:
+            Any: Whatever 'fn' returns.
+        """
+        attempt: int = 0
+        while True:
+            try:
+                return self.send(fn, *args, tokens=tokens, **kwargs)
+            except Exception as e:
+                retryable, throttled = _classify(e)
+                self._record(throttles=int(throttled))
+                if not retryable:
+                    raise
+                if attempt >= self.max_retries:
+                    self._record(failures=1)
+                    logger.error(f"Giving up after {attempt} retries: {e}")
+                    raise
+
+                delay: float = self.backoff(attempt, e)
+                self._record(retries=1)
+                logger.warning(
+                    f"Retryable Drive error ({_status(e) or type(e).__name__}), "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                self._sleep(delay)
+                attempt += 1
+
+    def send(
+        self, fn: Callable[..., Any], *args: Any, tokens: int = 1, **kwargs: Any
+    ) -> Any:
+        """
+        Runs a request-sending callable once under the rate limit, without
+        retrying: for callers that own their retries (see select_retries).
+
+        Args:
+            fn (Callable): Sends the request.
+            *args: Positional arguments for 'fn'.
+            tokens (int): Requests 'fn' sends (a batch counts every item).
+            **kwargs: Keyword arguments for 'fn'.
+
+        Returns:
+            Any: Whatever 'fn' returns.
+        """
+        waited: float = self.bucket.acquire(tokens)
+        with self._lock:
+            self.requests += tokens
+            self.throttled_seconds += waited
+        return fn(*args, **kwargs)
+
+    def select_retries(self, errors: dict[str, Exception], attempt: int) -> list[str]:
+        """
+        Picks the failed batch items worth resending and waits the backoff.
+
+        Args:
+            errors (Dict[str, Exception]): Item errors keyed by request ID.
+            attempt (int): How many times these items were already retried.
+
+        Returns:
+            List[str]: Request IDs to resend (empty if none are retryable).
+        """
+        retry_ids: list[str] = []
+        throttled_count: int = 0
+        for rid, error in errors.items():
+            retryable, throttled = _classify(error)
+            throttled_count += int(throttled)
+            if retryable:
+                retry_ids.append(rid)
+
+        if retry_ids and attempt >= self.max_retries:
+            self._record(throttles=throttled_count, failures=len(retry_ids))
+            return []
+
+        self._record(throttles=throttled_count, retries=len(retry_ids))
+        if retry_ids:
+            delay: float = max(self.backoff(attempt, errors[rid]) for rid in retry_ids)
+            logger.warning(
+                f"Resending {len(retry_ids)} rate-limited batch items in {delay:.1f}s"
+            )
+            self._sleep(delay)
+        return retry_ids
+
+    def backoff(self, attempt: int, error: Exception | None = None) -> float:
+        """
+        Returns the delay before retry number 'attempt' (0-based): Retry-After
+        if the server sent one, otherwise full jitter over base * 2**attempt.
+        """
+        retry_after: float | None = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        cap: float = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(0, cap)  # noqa: S311
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: requests, retries, throttles, failures and the
+                seconds spent waiting on the rate limiter.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttles": self.throttles,
+                "failures": self.failures,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+            }
+
+    def _record(self, retries: int = 0, throttles: int = 0, failures: int = 0) -> None:
+        with self._lock:
+            self.retries += retries
+            self.throttles += throttles
+            self.failures += failures
+
+
+def _status(error: Exception) -> int | None:
+    resp: Any = getattr(error, "resp", None)
+    return getattr(resp, "status", None) if resp is not None else None
+
+
+def _classify(error: Exception) -> tuple[bool, bool]:
+    """Returns (retryable, throttled) for an error raised by a Drive call."""
+    if isinstance(error, HttpError):
+        status: int | None = _status(error)
+        if status == 429:
+            return True, True
+        if status == 403:
+            throttled: bool = bool(_error_reasons(error) & RATE_LIMIT_REASONS)
+            return throttled, throttled
+        return status in RETRYABLE_STATUSES, False
+    return isinstance(error, TRANSPORT_ERRORS), False
+
+
+def _error_reasons(error: HttpError) -> set[str]:
+    """Extracts the 'reason' codes from a Drive error payload."""
+    try:
+        payload: Any = json.loads(error.content)
+        errors: list[dict[str, Any]] = payload["error"].get("errors", [])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return set()
+    return {e.get("reason", "") for e in errors}
+
+
+def _retry_after(error: Exception | None) -> float | None:
+    resp: Any = getattr(error, "resp", None)
+    try:
+        value: Any = resp.get("retry-after") if resp is not None else None
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,299 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from clients.core_lib.core_lib_client.logger_client import logger
+
+if TYPE_CHECKING:
+    from clients.gdrive.gdrive_client.client import GDriveClient
+
+# Metadata mirrored for every indexed file
+INDEX_FIELDS: Final[str] = "id, name, parents, mimeType, md5Checksum, modifiedTime"
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mime_type TEXT,
+    md5_checksum TEXT,
+    modified_time TEXT
+);
+CREATE TABLE IF NOT EXISTS parents (
+    parent_id TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    PRIMARY KEY (parent_id, file_id)
+);
+CREATE INDEX IF NOT EXISTS idx_parents_file ON parents (file_id);
+CREATE INDEX IF NOT EXISTS idx_files_name ON files (name);
+CREATE TABLE IF NOT EXISTS folders (
+    folder_id TEXT PRIMARY KEY,
+    seeded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class DriveIndex:
+    """
+    Persistent SQLite mirror of selected Drive folders.
+
+    Each folder is seeded with one full crawl; afterwards the index is kept
+    current from the Drive Changes feed, resuming from the page token saved
+    in the database. Lookups by name, prefix and folder are then answered
+    locally instead of re-listing the folder through the API.
+    """
+
+    def __init__(
+        self, client: "GDriveClient", db_path: str, refresh_interval: float = 30.0
+    ) -> None:
+        """
+        Args:
+            client (GDriveClient): Client used for the crawls and the Changes feed.
+            db_path (str): Location of the SQLite file (created if missing).
+            refresh_interval (float): Minimum seconds between two automatic
+                syncs triggered by lookups.
+        """
+        self.client: GDriveClient = client
+        self.db_path: str = db_path
+        self.refresh_interval: float = refresh_interval
+        self._last_sync: float = 0.0
+        self._lock: threading.RLock = threading.RLock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            db_path, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets several processes read the index while one of them syncs
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # --- Lifecycle ---
+
+    def seed(self, folder_id: str) -> int:
+        """
+        Crawls a folder once and starts tracking it.
+
+        The Changes start token is taken before the crawl, so nothing that
+        happens while the crawl runs is lost.
+
+        Args:
+            folder_id (str): The GDrive folder to index.
+
+        Returns:
+            int: Number of files indexed.
+        """
+        if self._get_state("page_token") is None:
+            response: dict[str, Any] = self.client._execute(
+                self.client.service.changes().getStartPageToken()
+            )
+            self._set_state("page_token", response["startPageToken"])
+
+        files: list[dict[str, Any]] = self.client._fetch_files(
+            f"'{folder_id}' in parents and trashed = false", fields=INDEX_FIELDS
+        )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM files WHERE id IN "
+                "(SELECT file_id FROM parents WHERE parent_id = ?)",
+                (folder_id,),
+            )
+            self._conn.execute("DELETE FROM parents WHERE parent_id = ?", (folder_id,))
+            for f in files:
+                self._upsert(f)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO folders (folder_id, seeded_at) VALUES (?, ?)",
+                (folder_id, time.time()),
+            )
+
+        logger.success(f"Indexed {len(files)} files from folder {folder_id}")
+        return len(files)
+
+    def sync(self) -> int:
+        """
+        Applies every change reported since the saved page token.
+
+        Returns:
+            int: Number of change records processed.
+        """
+        with self._lock:
+            page_token: str | None = self._get_state("page_token")
+            if page_token is None:
+                return 0
+
+            applied: int = 0
+            while page_token:
+                response: dict[str, Any] = self.client._execute(
+                    self.client.service.changes().list(
+                        pageToken=page_token,
+                        spaces="drive",
+                        pageSize=1000,
+                        includeRemoved=True,
+                        fields=(
+                            "nextPageToken, newStartPageToken, "
+                            f"changes(fileId, removed, file({INDEX_FIELDS}, trashed))"
+                        ),
+                    )
+                )
+
+                with self._conn:
+                    for change in response.get("changes", []):
+                        self._apply_change(change)
+                        applied += 1
+
+                    if "newStartPageToken" in response:
+                        self._set_state("page_token", response["newStartPageToken"])
+
+                page_token = response.get("nextPageToken")
+
+            self._last_sync = time.monotonic()
+            return applied
+
+    def maybe_sync(self) -> None:
+        """Syncs if the last sync is older than the refresh interval."""
+        if time.monotonic() - self._last_sync >= self.refresh_interval:
+            self.sync()
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # --- Queries ---
+
+    def covers(self, folder_id: str) -> bool:
+        """Returns True if the folder has been seeded into this index."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM folders WHERE folder_id = ?", (folder_id,)
+            ).fetchone()
+        return row is not None
+
+    def find(self, folder_id: str, file_name: str) -> list[dict[str, Any]]:
+        """Returns the indexed files with an exact name in a folder."""
+        return self._select(
+            "p.parent_id = ? AND f.name = ?", (folder_id, file_name), limit=None
+        )
+
+    def list_folder(
+        self, folder_id: str, prefix: str | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Lists the indexed files of a folder, optionally filtered by name prefix.
+
+        Args:
+            folder_id (str): The GDrive folder.
+            prefix (Optional[str]): Case-sensitive name prefix to match.
+            limit (Optional[int]): Maximum number of files to return.
+
+        Returns:
+            List[Dict[str, Any]]: Files ordered by name.
+        """
+        if prefix:
+            return self._select(
+                "p.parent_id = ? AND substr(f.name, 1, ?) = ?",
+                (folder_id, len(prefix), prefix),
+                limit=limit,
+            )
+        return self._select("p.parent_id = ?", (folder_id,), limit=limit)
+
+    # --- Write-through ---
+
+    def upsert(self, file: dict[str, Any]) -> None:
+        """Records a file created or updated by this process."""
+        with self._lock, self._conn:
+            self._upsert(file)
+
+    def remove(self, file_id: str) -> None:
+        """Forgets a file deleted by this process."""
+        with self._lock, self._conn:
+            self._remove(file_id)
+
+    # --- Internals ---
+
+    def _select(
+        self, where: str, params: tuple[Any, ...], limit: int | None
+    ) -> list[dict[str, Any]]:
+        sql: str = (
+            "SELECT f.id, f.name, f.mime_type, f.md5_checksum, f.modified_time "
+            f"FROM files f JOIN parents p ON p.file_id = f.id WHERE {where} "  # noqa: S608
+            "ORDER BY f.name"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        with self._lock:
+            rows: list[sqlite3.Row] = self._conn.execute(sql, params).fetchall()
+
+        files: list[dict[str, Any]] = []
+        for row in rows:
+            f: dict[str, Any] = {"id": row["id"], "name": row["name"]}
+            if row["mime_type"]:
+                f["mimeType"] = row["mime_type"]
+            if row["md5_checksum"]:
+                f["md5Checksum"] = row["md5_checksum"]
+            if row["modified_time"]:
+                f["modifiedTime"] = row["modified_time"]
+            files.append(f)
+        return files
+
+    def _apply_change(self, change: dict[str, Any]) -> None:
+        file: dict[str, Any] | None = change.get("file")
+        if change.get("removed") or not file or file.get("trashed"):
+            self._remove(change["fileId"])
+            return
+
+        tracked: bool = any(
+            self._conn.execute(
+                "SELECT 1 FROM folders WHERE folder_id = ?", (parent,)
+            ).fetchone()
+            for parent in file.get("parents", [])
+        )
+        if tracked:
+            self._upsert(file)
+        else:
+            # Moved out of every indexed folder (or never inside one)
+            self._remove(change["fileId"])
+
+    def _upsert(self, file: dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files "
+            "(id, name, mime_type, md5_checksum, modified_time) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                file["id"],
+                file.get("name", ""),
+                file.get("mimeType"),
+                file.get("md5Checksum"),
+                file.get("modifiedTime"),
+            ),
+        )
+        if "parents" in file:
+            self._conn.execute("DELETE FROM parents WHERE file_id = ?", (file["id"],))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO parents (parent_id, file_id) VALUES (?, ?)",
+                [(parent, file["id"]) for parent in file["parents"]],
+            )
+
+    def _remove(self, file_id: str) -> None:
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self._conn.execute("DELETE FROM parents WHERE file_id = ?", (file_id,))
+
+    def _get_state(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
+            )
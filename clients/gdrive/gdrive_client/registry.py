@@ -0,0 +1,60 @@
+import os
+import threading
+
+from clients.gdrive.gdrive_client.client import (
+    DEFAULT_SCOPES,
+    GDriveClient,
+    resolve_auth_paths,
+)
+
+RegistryKey = tuple[str, str, tuple[str, ...]]
+
+_clients: dict[RegistryKey, GDriveClient] = {}
+_lock: threading.Lock = threading.Lock()
+
+
+def get_gdrive_client(
+    credentials_path: str | None = None,
+    token_path: str | None = None,
+    scopes: list[str] | None = None,
+) -> GDriveClient:
+    """
+    Returns the process-wide GDriveClient for a (credentials, token, scopes) set.
+
+    The first call creates the client; later calls with the same
+    configuration reuse it, together with its authorized service, per-thread
+    HTTP connections and metadata cache. Callers that need a private cache,
+    index or executor should construct a GDriveClient directly instead.
+
+    Args:
+        credentials_path (Optional[str]): OAuth client secrets file.
+        token_path (Optional[str]): Where the authorized token is stored.
+        scopes (Optional[List[str]]): OAuth scopes. Defaults to full Drive access.
+
+    Returns:
+        GDriveClient: The shared client.
+    """
+    creds_path, resolved_token = resolve_auth_paths(credentials_path, token_path)
+    resolved_scopes: tuple[str, ...] = tuple(sorted(scopes or DEFAULT_SCOPES))
+    key: RegistryKey = (
+        os.path.abspath(creds_path),
+        os.path.abspath(resolved_token),
+        resolved_scopes,
+    )
+
+    with _lock:
+        client: GDriveClient | None = _clients.get(key)
+        if client is None:
+            client = GDriveClient(
+                credentials_path=creds_path,
+                token_path=resolved_token,
+                scopes=list(resolved_scopes),
+            )
+            _clients[key] = client
+        return client
+
+
+def clear_gdrive_clients() -> None:
+    """Forgets every shared client (e.g. after rotating credentials)."""
+    with _lock:
+        _clients.clear()
@@ -0,0 +1,122 @@
+import json
+import os
+import time
+from typing import Any
+
+from googleapiclient.errors import HttpError
+
+from clients.core_lib.core_lib_client.file_lock import atomic_write, file_lock
+
+
+class UploadSessionStore:
+    """
+    Small JSON sidecar that remembers in-flight resumable upload sessions.
+
+    Each entry holds the session URI returned by Drive and the last offset
+    the server committed, together with the size and mtime of the local file
+    so that a modified file never resumes into a stale session. Updates are
+    read-modify-write cycles under a file lock, so several stores (or
+    processes) sharing one token directory never drop each other's entries.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Location of the JSON sidecar (created on first save).
+        """
+        self.path: str = path
+
+    @staticmethod
+    def fingerprint(file_path: str) -> dict[str, int]:
+        """Returns the size and mtime used to validate a saved session."""
+        stat: os.stat_result = os.stat(file_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def get(self, key: str, file_path: str) -> dict[str, Any] | None:
+        """
+        Returns the saved session for 'key' if the local file is unchanged.
+
+        Args:
+            key (str): Session key (local path + destination).
+            file_path (str): Local file the session uploads.
+
+        Returns:
+            Optional[Dict[str, Any]]: The session ('uri', 'offset', ...) or None.
+        """
+        with file_lock(self.path):
+            session: dict[str, Any] | None = self._load().get(key)
+
+        if session is None:
+            return None
+
+        current: dict[str, int] = self.fingerprint(file_path)
+        if any(session.get(k) != v for k, v in current.items()):
+            self.discard(key)
+            return None
+        return session
+
+    def save(self, key: str, file_path: str, uri: str, offset: int) -> None:
+        """Persists the session URI and the committed offset."""
+        with file_lock(self.path):
+            sessions: dict[str, Any] = self._load()
+            sessions[key] = {
+                "uri": uri,
+                "offset": offset,
+                "updated_at": time.time(),
+                **self.fingerprint(file_path),
+            }
+            self._write(sessions)
+
+    def discard(self, key: str) -> None:
+        """Forgets a finished or invalid session."""
+        with file_lock(self.path):
+            sessions: dict[str, Any] = self._load()
+            if sessions.pop(key, None) is not None:
+                self._write(sessions)
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.path) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, sessions: dict[str, Any]) -> None:
+        # Replace atomically so a crash mid-write never corrupts the sidecar
+        atomic_write(self.path, json.dumps(sessions))
+
+
+def query_session(
+    http: Any, uri: str, size: int
+) -> tuple[int | None, dict[str, Any] | None]:
+    """
+    Asks Drive how many bytes of a resumable session it has committed.
+
+    Args:
+        http: Authorized HTTP object used to send the status request.
+        uri (str): The resumable session URI.
+        size (int): Total size of the upload in bytes.
+
+    Returns:
+        Tuple: (offset, None) while the upload is incomplete, (size, resource)
+            if it already finished, or (None, None) if the session expired.
+
+    Raises:
+        HttpError: For any other status (e.g. 429/5xx), so a transient
+            failure is retried instead of discarding the session's progress.
+    """
+    headers: dict[str, str] = {
+        "Content-Range": f"bytes */{size}",
+        "Content-Length": "0",
+    }
+    resp, content = http.request(uri, "PUT", headers=headers)
+
+    if resp.status in (200, 201):
+        return size, json.loads(content or b"{}")
+    if resp.status == 308:
+        # 'range: bytes=0-N' means N + 1 bytes are stored; no header means none
+        committed: str | None = resp.get("range")
+        return (int(committed.split("-")[1]) + 1 if committed else 0), None
+    if resp.status in (404, 410):
+        return None, None
+    raise HttpError(resp, content, uri=uri)
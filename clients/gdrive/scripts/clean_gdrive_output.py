@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -30,42 +31,27 @@ def main() -> None:
 
     logger.info(f"Starting SAFE cleanup (Trash) in output folder (ID: {output_id})")
 
-    # 1. Get all files in the folder
-    files_to_trash: list[dict[str, str]] = client.list_files(
-        folder_id=output_id,
-        limit=1000,
+    # Batched trash: one round trip per 100 items instead of one per file
+    trashed_ids: list[str] = client.clear_folder_content(output_id, trash=True)
+
+    # Whatever is still listed failed to move (each failure is logged above)
+    remaining: int = sum(
+        1 for _ in client.iter_files(f"'{output_id}' in parents and trashed = false")
     )
 
-    if not files_to_trash:
+    # Final Execution Report
+    if remaining:
+        logger.error(
+            f"Cleanup incomplete: {remaining} items could not be moved to the "
+            f"Trash ({len(trashed_ids)} moved)."
+        )
+        sys.exit(1)
+
+    if not trashed_ids:
         logger.info("Folder is already empty. No action needed.")
         return
 
-    logger.warning(f"Found {len(files_to_trash)} items. Moving to Trash...")
-
-    # 2. Update files to set 'trashed' to True
-    trashed_ids: list[str] = []
-    for f in files_to_trash:
-        file_name: str = f.get("name", "Unknown Name")
-        file_id: str = f.get("id", "Unknown ID")
-
-        try:
-            logger.warning(f"Trashing: {file_name} (ID: {file_id})")
-
-            # Using update instead of delete for safety
-            client.service.files().update(
-                fileId=file_id, body={"trashed": True}
-            ).execute()
-
-            trashed_ids.append(file_id)
-
-        except Exception as e:
-            logger.error(f"Failed to trash {file_name}: {e}")
-
-    # Final Execution Report
-    if trashed_ids:
-        logger.success(
-            f"Cleanup complete! Moved {len(trashed_ids)} items to the Trash."
-        )
+    logger.success(f"Cleanup complete! Moved {len(trashed_ids)} items to the Trash.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import AsyncGDriveClient, GDriveClient
+
+
+@pytest.mark.unit
+def test_concurrency_is_bounded(mock_client: GDriveClient) -> None:
+    """No more than max_concurrency blocking calls run at the same time."""
+    lock: threading.Lock = threading.Lock()
+    running: list[int] = [0, 0]  # current, peak
+
+    def _slow_exists(file_name: str, folder_id: str) -> bool:
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return True
+
+    mock_client.file_exists = _slow_exists  # type: ignore[method-assign]
+
+    async def _main() -> list[bool]:
+        async with AsyncGDriveClient(mock_client, max_concurrency=3) as client:
+            return await asyncio.gather(
+                *(client.file_exists(f"f{i}", "folder") for i in range(12))
+            )
+
+    assert asyncio.run(_main()) == [True] * 12
+    assert running[1] == 3
+
+
+@pytest.mark.unit
+def test_cancelled_download_leaves_no_partial_file(
+    mock_client: GDriveClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cancelling between chunks removes the temporary file."""
+
+    class EndlessDownloader:
+        def __init__(self, fh: Any, request: Any, chunksize: int) -> None:
+            self.fh = fh
+
+        def next_chunk(self) -> tuple[None, bool]:
+            self.fh.write(b"chunk")
+            time.sleep(0.01)
+            return None, False
+
+    monkeypatch.setattr(
+        "clients.gdrive.gdrive_client.async_client.MediaIoBaseDownload",
+        EndlessDownloader,
+    )
+    mock_client.get_mime_type = MagicMock(return_value="text/csv")  # type: ignore[method-assign]
+    target_dir: Path = tmp_path / "downloads"
+
+    async def _main() -> None:
+        async with AsyncGDriveClient(mock_client) as client:
+            task = asyncio.create_task(
+                client.download_file("id", str(target_dir / "data.csv"))
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(_main())
+    assert list(target_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_async_iter_files_yields_all(mock_client: GDriveClient) -> None:
+    """The async iterator drains the synchronous listing page by page."""
+    files: list[dict[str, str]] = [{"id": str(i), "name": f"f{i}"} for i in range(5)]
+    mock_client.iter_files = MagicMock(return_value=iter(files))  # type: ignore[method-assign]
+
+    async def _main() -> list[dict[str, Any]]:
+        async with AsyncGDriveClient(mock_client) as client:
+            return [f async for f in client.iter_files("q", page_size=2)]
+
+    assert asyncio.run(_main()) == files
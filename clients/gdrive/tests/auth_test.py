@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive.gdrive_client import auth
+from clients.gdrive.gdrive_client.auth import CredentialManager
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class FakeCredentials:
+    """Minimal stand-in for google.oauth2.credentials.Credentials."""
+
+    refresh_calls: int = 0
+
+    def __init__(self, token: str, expiry: datetime, refresh_token: str = "r") -> None:
+        self.token = token
+        self.expiry = expiry
+        self.refresh_token = refresh_token
+
+    @property
+    def valid(self) -> bool:
+        return self.expiry > _now()
+
+    def refresh(self, _request: Any) -> None:
+        time.sleep(0.02)
+        FakeCredentials.refresh_calls += 1
+        self.token = f"fresh-{FakeCredentials.refresh_calls}"
+        self.expiry = _now() + timedelta(hours=1)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "token": self.token,
+                "expiry": self.expiry.isoformat(),
+                "refresh_token": self.refresh_token,
+            }
+        )
+
+    @classmethod
+    def from_authorized_user_file(cls, path: str, _scopes: Any) -> "FakeCredentials":
+        with open(path) as fh:
+            data: dict[str, str] = json.load(fh)
+        return cls(
+            data["token"], datetime.fromisoformat(data["expiry"]), data["refresh_token"]
+        )
+
+
+@pytest.fixture
+def token_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """A token file holding an access token that expired a minute ago."""
+    monkeypatch.setattr(auth, "Credentials", FakeCredentials)
+    monkeypatch.setattr(auth, "Request", MagicMock())
+    FakeCredentials.refresh_calls = 0
+
+    path: Path = tmp_path / "token.json"
+    path.write_text(FakeCredentials("old", _now() - timedelta(minutes=1)).to_json())
+    return str(path)
+
+
+def _manager(token_path: str) -> CredentialManager:
+    return CredentialManager(
+        "credentials.json", token_path, ["scope"], background_refresh=False
+    )
+
+
+@pytest.mark.unit
+def test_parallel_workers_refresh_once(token_path: str) -> None:
+    """Managers racing on one token file (as separate processes would) refresh once."""
+    managers: list[CredentialManager] = [_manager(token_path) for _ in range(6)]
+    tokens: list[str] = []
+
+    def _get(manager: CredentialManager) -> None:
+        tokens.append(manager.get().token)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=_get, args=(m,)) for m in managers
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert FakeCredentials.refresh_calls == 1
+    assert set(tokens) == {"fresh-1"}
+    assert json.loads(Path(token_path).read_text())["token"] == "fresh-1"
+
+
+@pytest.mark.unit
+def test_token_is_renewed_before_expiry(token_path: str) -> None:
+    """A still-valid token inside the refresh margin is renewed proactively."""
+    Path(token_path).write_text(
+        FakeCredentials("soon", _now() + timedelta(seconds=60)).to_json()
+    )
+    manager: CredentialManager = _manager(token_path)
+
+    creds: Any = manager.get()
+
+    assert creds.token == "fresh-1"
+    assert manager.get() is creds
+    assert FakeCredentials.refresh_calls == 1
+
+
+@pytest.mark.unit
+def test_background_refresh_is_scheduled(token_path: str) -> None:
+    """After a refresh, a timer is armed for refresh_margin before the new expiry."""
+    manager: CredentialManager = CredentialManager(
+        "credentials.json", token_path, ["scope"], refresh_margin=300
+    )
+    try:
+        manager.get()
+        assert manager._timer is not None
+        assert manager._timer.interval == pytest.approx(3600 - 300, abs=5)
+    finally:
+        manager.close()
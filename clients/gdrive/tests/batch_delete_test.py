@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.client import BATCH_LIMIT
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+def _files(count: int, prefix: str = "file_") -> list[dict[str, str]]:
+    return [{"id": f"id{i}", "name": f"{prefix}{i}.csv"} for i in range(count)]
+
+
+@pytest.mark.unit
+def test_clear_folder_splits_into_batches(
+    mock_client: GDriveClient, batches: BatchRecorder
+) -> None:
+    """Deletes are grouped into batches of at most BATCH_LIMIT calls."""
+    files: list[dict[str, str]] = _files(BATCH_LIMIT * 2 + 5)
+    mock_client._fetch_files = MagicMock(return_value=files)  # type: ignore[method-assign]
+
+    deleted: list[str] = mock_client.clear_folder_content("folder")
+
+    assert deleted == [f["id"] for f in files]
+    assert [len(b.request_ids) for b in batches.batches] == [
+        BATCH_LIMIT,
+        BATCH_LIMIT,
+        5,
+    ]
+    mock_client.service.files().update.assert_not_called()
+
+
+@pytest.mark.unit
+def test_batch_delete_collects_per_item_errors(
+    mock_client: GDriveClient, batches: BatchRecorder
+) -> None:
+    """A failing item is reported without aborting the rest of the batch."""
+    batches.fail_ids.add("id1")
+    mock_client._fetch_files = MagicMock(return_value=_files(3))  # type: ignore[method-assign]
+
+    deleted: list[str] = mock_client.clear_folder_content("folder")
+
+    assert deleted == ["id0", "id2"]
+
+
+@pytest.mark.unit
+def test_trash_failures_are_reported_as_trash(
+    mock_client: GDriveClient,
+    batches: BatchRecorder,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A failed trash call is not logged as a failed (permanent) delete."""
+    batches.fail_ids.add("id0")
+    mock_client._fetch_files = MagicMock(return_value=_files(1))  # type: ignore[method-assign]
+
+    assert mock_client.clear_folder_content("folder", trash=True) == []
+
+    err: str = capsys.readouterr().err
+    assert "Failed to trash file file_0.csv (id0)" in err
+    assert "Failed to delete" not in err
+
+
+@pytest.mark.unit
+def test_prefix_delete_can_trash(
+    mock_client: GDriveClient, batches: BatchRecorder
+) -> None:
+    """Trash mode issues updates instead of deletes and keeps prefix filtering."""
+    files: list[dict[str, str]] = _files(2, "test_") + [
+        {"id": "other", "name": "backup_test_1.csv"}
+    ]
+    mock_client.iter_files = MagicMock(return_value=iter(files))  # type: ignore[method-assign]
+
+    trashed: list[str] = mock_client.delete_files_by_prefix(
+        "folder", "test_", trash=True
+    )
+
+    assert trashed == ["id0", "id1"]
+    mock_client.service.files().update.assert_called_with(
+        fileId="id1", body={"trashed": True}
+    )
+    mock_client.service.files().delete.assert_not_called()
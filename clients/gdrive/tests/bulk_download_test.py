@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+@pytest.mark.unit
+def test_download_files_is_atomic_and_reports_throughput(
+    mock_client: GDriveClient, batches: BatchRecorder, tmp_path: Path
+) -> None:
+    """Metadata comes from one batch; failed transfers leave no partial files."""
+    batches.responses.update(
+        {
+            "ok": {"id": "ok", "mimeType": "text/csv"},
+            "bad": {"id": "bad", "mimeType": "text/csv"},
+        }
+    )
+    batches.fail_ids.add("gone")
+
+    def _fake_transfer(request: Any, fh: Any, report_progress: bool = True) -> None:
+        fh.write(b"x" * 10)
+        if request is bad_request:
+            raise OSError("connection reset")
+
+    ok_request: MagicMock = MagicMock()
+    bad_request: MagicMock = MagicMock()
+    mock_client._media_request = MagicMock(  # type: ignore[method-assign]
+        side_effect=lambda fid, _mime: bad_request if fid == "bad" else ok_request
+    )
+    mock_client._transfer = _fake_transfer  # type: ignore[method-assign]
+
+    mapping: dict[str, str] = {
+        fid: str(tmp_path / "out" / f"{fid}.csv") for fid in ("ok", "bad", "gone")
+    }
+    report: dict[str, Any] = mock_client.download_files(mapping, max_workers=3)
+
+    assert len(batches.batches) == 1
+    errors: dict[str, Any] = {f["id"]: f["error"] for f in report["files"]}
+    assert errors["ok"] is None
+    assert errors["bad"] and errors["gone"]
+    assert report["total_bytes"] == 10
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["ok.csv"]
+
+
+@pytest.mark.unit
+def test_iter_download_chunks_yields_each_chunk(
+    mock_client: GDriveClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chunks are handed over one by one and the buffer is reset in between."""
+    payload: list[bytes] = [b"abc", b"def", b"g"]
+
+    class FakeDownloader:
+        def __init__(self, fh: Any, request: Any, chunksize: int) -> None:
+            assert chunksize == 4
+            self.fh = fh
+            self.remaining: list[bytes] = list(payload)
+
+        def next_chunk(self) -> tuple[None, bool]:
+            self.fh.write(self.remaining.pop(0))
+            return None, not self.remaining
+
+    monkeypatch.setattr(
+        "clients.gdrive.gdrive_client.client.MediaIoBaseDownload", FakeDownloader
+    )
+    mock_client.get_mime_type = MagicMock(return_value="text/csv")  # type: ignore[method-assign]
+
+    assert list(mock_client.iter_download_chunks("id", chunk_size=4)) == payload
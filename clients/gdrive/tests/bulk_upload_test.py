@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+
+
+@pytest.mark.unit
+def test_upload_files_lists_folder_once(
+    mock_client: GDriveClient, tmp_path: Path
+) -> None:
+    """Existing names are updated, new ones created, with a single listing."""
+    paths: list[str] = []
+    for name in ("a.txt", "b.txt"):
+        path: Path = tmp_path / name
+        path.write_text(name)
+        paths.append(str(path))
+
+    mock_client._fetch_files = MagicMock(  # type: ignore[method-assign]
+        return_value=[{"id": "old-a", "name": "a.txt"}]
+    )
+    files: MagicMock = mock_client.service.files()
+    files.update.return_value.next_chunk.return_value = (None, {"id": "old-a"})
+    files.create.return_value.next_chunk.return_value = (None, {"id": "new-b"})
+
+    results: list[dict[str, Any]] = mock_client.upload_files(
+        paths, "folder", max_workers=2
+    )
+
+    mock_client._fetch_files.assert_called_once()
+    files.list.assert_not_called()
+    assert [(r["name"], r["id"], r["action"]) for r in results] == [
+        ("a.txt", "old-a", "updated"),
+        ("b.txt", "new-b", "created"),
+    ]
+
+
+@pytest.mark.unit
+def test_upload_files_reports_failures(
+    mock_client: GDriveClient, tmp_path: Path
+) -> None:
+    """A missing local file is reported without stopping the other uploads."""
+    good: Path = tmp_path / "good.txt"
+    good.write_text("ok")
+    mock_client.service.files().create.return_value.next_chunk.return_value = (
+        None,
+        {"id": "new"},
+    )
+
+    results: list[dict[str, Any]] = mock_client.upload_files(
+        [str(good), str(tmp_path / "missing.txt")], "folder", overwrite=False
+    )
+
+    assert [r["action"] for r in results] == ["created", "failed"]
+    assert results[1]["error"]
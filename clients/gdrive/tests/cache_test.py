@@ -0,0 +1,61 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.cache import MetadataCache
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_cache_expires_and_evicts() -> None:
+    """Entries expire after the TTL and the least recently used key is evicted."""
+    clock: FakeClock = FakeClock()
+    cache: MetadataCache = MetadataCache(max_entries=2, ttl=10, clock=clock)
+
+    cache.put("f", "a", [{"id": "1", "name": "a"}])
+    cache.put("f", "b", [])
+    assert cache.get("f", "a") == [{"id": "1", "name": "a"}]
+
+    cache.put("f", "c", [])  # evicts 'b', the least recently used
+    assert cache.get("f", "b") is None
+
+    clock.now = 11
+    assert cache.get("f", "a") is None
+
+    stats: dict = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+    assert stats["expirations"] == 1
+
+
+@pytest.mark.unit
+def test_client_probes_hit_cache_and_writes_go_through(
+    mock_client: GDriveClient, batches: BatchRecorder, tmp_path: Path
+) -> None:
+    """Repeated probes cost one query; uploads and deletes update the cache."""
+    mock_client.cache = MetadataCache()
+    files: MagicMock = mock_client.service.files()
+    files.list.return_value.execute.return_value = {"files": []}
+    files.create.return_value.next_chunk.return_value = (None, {"id": "new"})
+
+    assert mock_client.file_exists("a.txt", "folder") is False
+    assert mock_client.file_exists("a.txt", "folder") is False
+    assert files.list.return_value.execute.call_count == 1
+
+    local: Path = tmp_path / "a.txt"
+    local.write_text("data")
+    mock_client.upload_file(str(local), "folder")
+    assert mock_client.file_exists("a.txt", "folder") is True
+
+    assert mock_client.delete_specific_file("a.txt", "folder") is True
+    assert mock_client.file_exists("a.txt", "folder") is False
+    assert files.list.return_value.execute.call_count == 1
@@ -0,0 +1,33 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.executor import RequestExecutor, TokenBucket
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+@pytest.fixture
+def mock_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> GDriveClient:
+    """
+    GDriveClient wired to a MagicMock service, so no OAuth flow or network
+    access happens during unit tests. Rate limiting and backoff sleeps are off.
+    """
+    creds_path: Path = tmp_path / "credentials.json"
+    creds_path.write_text("{}")
+
+    monkeypatch.setattr(GDriveClient, "_init_service", lambda self: MagicMock())
+    return GDriveClient(
+        credentials_path=str(creds_path),
+        token_path=str(tmp_path / "token.json"),
+        executor=RequestExecutor(bucket=TokenBucket(rate=0), sleep=lambda _: None),
+    )
+
+
+@pytest.fixture
+def batches(mock_client: GDriveClient) -> BatchRecorder:
+    """Routes new_batch_http_request through FakeBatch."""
+    recorder: BatchRecorder = BatchRecorder()
+    mock_client.service.new_batch_http_request.side_effect = recorder.factory
+    return recorder
@@ -0,0 +1,124 @@
+import json
+from unittest.mock import MagicMock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.executor import RequestExecutor, TokenBucket
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+def _http_error(status: int, reason: str = "") -> HttpError:
+    content: bytes = json.dumps(
+        {"error": {"errors": [{"reason": reason}], "message": reason}}
+    ).encode()
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+def _executor(sleeps: list[float]) -> RequestExecutor:
+    return RequestExecutor(
+        bucket=TokenBucket(rate=0), max_retries=3, sleep=sleeps.append
+    )
+
+
+@pytest.mark.unit
+def test_retries_rate_limits_then_succeeds() -> None:
+    """429 and userRateLimitExceeded 403 are retried with bounded backoff."""
+    sleeps: list[float] = []
+    executor: RequestExecutor = _executor(sleeps)
+    fn: MagicMock = MagicMock(
+        side_effect=[
+            _http_error(429),
+            _http_error(403, "userRateLimitExceeded"),
+            {"id": "ok"},
+        ]
+    )
+
+    assert executor.call(fn) == {"id": "ok"}
+    assert len(sleeps) == 2
+    assert all(0 <= s <= executor.max_delay for s in sleeps)
+    assert executor.stats()["retries"] == 2
+    assert executor.stats()["throttles"] == 2
+
+
+@pytest.mark.unit
+def test_permanent_errors_are_not_retried() -> None:
+    """A 404 or a permission 403 is raised immediately."""
+    sleeps: list[float] = []
+    executor: RequestExecutor = _executor(sleeps)
+
+    for error in (
+        _http_error(404, "notFound"),
+        _http_error(403, "insufficientFilePermissions"),
+    ):
+        with pytest.raises(HttpError):
+            executor.call(MagicMock(side_effect=error))
+
+    assert sleeps == []
+    assert executor.stats()["retries"] == 0
+
+
+@pytest.mark.unit
+def test_gives_up_after_max_retries() -> None:
+    """Persistent 503s stop after max_retries and count as a failure."""
+    executor: RequestExecutor = _executor([])
+
+    with pytest.raises(HttpError):
+        executor.call(MagicMock(side_effect=_http_error(503)))
+
+    assert executor.stats()["retries"] == 3
+    assert executor.stats()["failures"] == 1
+
+
+@pytest.mark.unit
+def test_token_bucket_spaces_requests() -> None:
+    """Once the burst is spent, each request waits 1 / rate seconds."""
+    now: list[float] = [0.0]
+    waits: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket: TokenBucket = TokenBucket(
+        rate=10, capacity=2, clock=lambda: now[0], sleep=_sleep
+    )
+    for _ in range(4):
+        bucket.acquire()
+
+    assert waits == pytest.approx([0.1, 0.1])
+
+
+@pytest.mark.unit
+def test_batch_resends_rate_limited_items(
+    mock_client: GDriveClient, batches: BatchRecorder
+) -> None:
+    """Throttled batch items are resent alone; the others are not repeated."""
+    batches.errors["id1"] = [_http_error(403, "rateLimitExceeded")]
+    files: list[dict[str, str]] = [{"id": f"id{i}", "name": f"f{i}"} for i in range(3)]
+    mock_client._fetch_files = MagicMock(return_value=files)  # type: ignore[method-assign]
+
+    deleted: list[str] = mock_client.clear_folder_content("folder")
+
+    assert deleted == ["id0", "id1", "id2"]
+    assert [b.request_ids for b in batches.batches] == [["id0", "id1", "id2"], ["id1"]]
+    assert mock_client.executor.stats()["throttles"] == 1
+
+
+@pytest.mark.unit
+def test_rejected_batch_is_retried_once_per_round(
+    mock_client: GDriveClient, batches: BatchRecorder
+) -> None:
+    """Whole-batch 503s are resent by the batch loop only; the last error wins."""
+    first, last = _http_error(503, "first"), _http_error(503, "last")
+    max_retries: int = mock_client.executor.max_retries
+    batches.batch_errors.extend([first] + [_http_error(503)] * (max_retries - 1))
+    batches.batch_errors.append(last)
+
+    responses, errors = mock_client._execute_batch({"id0": MagicMock()})
+
+    assert responses == {}
+    assert errors == {"id0": last}
+    assert len(batches.batches) == max_retries + 1
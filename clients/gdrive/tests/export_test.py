@@ -0,0 +1,77 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.client import EXPORT_DEFAULTS, XLSX_MIME_TYPE
+from clients.gdrive.tests.helpers import FakeResponse
+
+DOC_MIME_TYPE: str = "application/vnd.google-apps.document"
+
+
+@pytest.mark.unit
+def test_export_format_defaults_per_type(mock_client: GDriveClient) -> None:
+    """Docs export to their own default; callers can override the format."""
+    export_media: MagicMock = mock_client.service.files().export_media
+
+    mock_client._media_request("doc", DOC_MIME_TYPE)
+    export_media.assert_called_with(
+        fileId="doc", mimeType=EXPORT_DEFAULTS[DOC_MIME_TYPE]
+    )
+
+    mock_client._media_request("doc", DOC_MIME_TYPE, export_mime_type="text/plain")
+    export_media.assert_called_with(fileId="doc", mimeType="text/plain")
+
+    mock_client._media_request("sheet", "application/vnd.google-apps.spreadsheet")
+    export_media.assert_called_with(fileId="sheet", mimeType=XLSX_MIME_TYPE)
+
+
+@pytest.mark.unit
+def test_export_sheet_csv_targets_the_sheet_gid(mock_client: GDriveClient) -> None:
+    """Sheets are resolved by title or position (zero IDs are omitted by the API)."""
+    mock_client._sheets_service = MagicMock()
+    mock_client._execute = MagicMock(  # type: ignore[method-assign]
+        return_value={
+            "sheets": [
+                {"properties": {"title": "Summary"}},
+                {"properties": {"sheetId": 1234, "title": "Raw", "index": 1}},
+            ]
+        }
+    )
+    http: MagicMock = MagicMock()
+    http.request.return_value = (FakeResponse(200), b"a,b\n1,2\n")
+    mock_client._thread_http = MagicMock(return_value=http)  # type: ignore[method-assign]
+
+    assert mock_client.export_sheet_csv("sid", "Raw").read() == b"a,b\n1,2\n"
+    assert http.request.call_args.args[0].endswith("/d/sid/export?format=csv&gid=1234")
+
+    mock_client.export_sheet_csv("sid")
+    assert http.request.call_args.args[0].endswith("gid=0")
+
+    with pytest.raises(ValueError, match="Missing"):
+        mock_client.export_sheet_csv("sid", "Missing")
+
+
+@pytest.mark.unit
+def test_export_sheet_csv_without_sheets_api(mock_client: GDriveClient) -> None:
+    """A disabled Sheets API falls back to Drive's export for the first sheet only."""
+    mock_client._sheets_service = MagicMock()
+    mock_client._execute = MagicMock(  # type: ignore[method-assign]
+        side_effect=HttpError(
+            FakeResponse(403),
+            b'{"error": {"errors": [{"reason": "accessNotConfigured"}]}}',
+        )
+    )
+    mock_client.download_to_buffer = MagicMock(  # type: ignore[method-assign]
+        return_value=io.BytesIO(b"a\n1\n")
+    )
+
+    assert mock_client.export_sheet_csv("sid").read() == b"a\n1\n"
+    mock_client.download_to_buffer.assert_called_once_with(
+        "sid", export_mime_type="text/csv"
+    )
+
+    with pytest.raises(RuntimeError, match="Sheets API is not enabled"):
+        mock_client.export_sheet_csv("sid", "Raw")
@@ -0,0 +1,72 @@
+from collections.abc import Callable
+from typing import Any
+
+
+class FakeResponse(dict):
+    """httplib2-style response: a header dict with 'status' and 'reason'."""
+
+    def __init__(
+        self, status: int, headers: dict[str, str] | None = None, reason: str = ""
+    ) -> None:
+        super().__init__(headers or {})
+        self.status = status
+        self.reason = reason
+
+
+class FakeBatch:
+    """
+    In-memory stand-in for googleapiclient's BatchHttpRequest.
+    Replays every added call through the callback, failing the IDs in 'fail_ids',
+    raising the next queued error of 'errors' once per ID, and answering the
+    others from 'responses'. Each queued error of 'batch_errors' rejects one
+    whole execute call instead.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[..., None],
+        fail_ids: set[str],
+        responses: dict[str, Any],
+        errors: dict[str, list[Exception]] | None = None,
+        batch_errors: list[Exception] | None = None,
+    ) -> None:
+        self.callback = callback
+        self.fail_ids = fail_ids
+        self.responses = responses
+        self.errors = errors if errors is not None else {}
+        self.batch_errors = batch_errors if batch_errors is not None else []
+        self.request_ids: list[str] = []
+
+    def add(self, request: Any, request_id: str | None = None, **_: Any) -> None:
+        self.request_ids.append(request_id or str(len(self.request_ids)))
+
+    def execute(self, http: Any = None) -> None:
+        if self.batch_errors:
+            raise self.batch_errors.pop(0)
+        for rid in self.request_ids:
+            queued: list[Exception] = self.errors.get(rid, [])
+            error: Exception | None = None
+            if queued:
+                error = queued.pop(0)
+            elif rid in self.fail_ids:
+                error = Exception(f"boom {rid}")
+            response: Any = None if error else self.responses.get(rid, {})
+            self.callback(rid, response, error)
+
+
+class BatchRecorder:
+    """Collects every FakeBatch created by the service and their canned results."""
+
+    def __init__(self) -> None:
+        self.batches: list[FakeBatch] = []
+        self.fail_ids: set[str] = set()
+        self.responses: dict[str, Any] = {}
+        self.errors: dict[str, list[Exception]] = {}
+        self.batch_errors: list[Exception] = []
+
+    def factory(self, callback: Callable[..., None]) -> FakeBatch:
+        batch: FakeBatch = FakeBatch(
+            callback, self.fail_ids, self.responses, self.errors, self.batch_errors
+        )
+        self.batches.append(batch)
+        return batch
@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.index import DriveIndex
+
+
+def _file(file_id: str, name: str, parent: str = "folder") -> dict[str, Any]:
+    return {
+        "id": file_id,
+        "name": name,
+        "parents": [parent],
+        "mimeType": "text/csv",
+        "md5Checksum": f"md5-{file_id}",
+        "modifiedTime": "2026-01-01T00:00:00.000Z",
+    }
+
+
+@pytest.fixture
+def indexed_client(mock_client: GDriveClient, tmp_path: Path) -> GDriveClient:
+    """Client with 'folder' seeded into a fresh index and an empty Changes feed."""
+    changes: MagicMock = mock_client.service.changes()
+    changes.getStartPageToken.return_value.execute.return_value = {
+        "startPageToken": "t1"
+    }
+    changes.list.return_value.execute.return_value = {
+        "changes": [],
+        "newStartPageToken": "t1",
+    }
+    mock_client._fetch_files = MagicMock(  # type: ignore[method-assign]
+        return_value=[_file("1", "report_a.csv"), _file("2", "summary.csv")]
+    )
+    mock_client.attach_index(str(tmp_path / "index.sqlite"), ["folder"])
+    return mock_client
+
+
+@pytest.mark.unit
+def test_lookups_are_answered_locally(indexed_client: GDriveClient) -> None:
+    """Existence, listing and prefix queries never hit files().list."""
+    files: MagicMock = indexed_client.service.files()
+
+    assert indexed_client.file_exists("report_a.csv", "folder") is True
+    assert indexed_client.file_exists("missing.csv", "folder") is False
+    assert [f["id"] for f in indexed_client.list_files("folder", limit=5)] == [
+        "1",
+        "2",
+    ]
+    index: DriveIndex = indexed_client.index  # type: ignore[assignment]
+    assert [f["name"] for f in index.list_folder("folder", prefix="rep")] == [
+        "report_a.csv"
+    ]
+    files.list.assert_not_called()
+
+
+@pytest.mark.unit
+def test_sync_applies_changes_and_persists_token(
+    indexed_client: GDriveClient, tmp_path: Path
+) -> None:
+    """Changes add, move out and remove files; the new token survives reopening."""
+    changes: MagicMock = indexed_client.service.changes()
+    changes.list.return_value.execute.side_effect = [
+        {
+            "nextPageToken": "t2",
+            "changes": [
+                {"fileId": "3", "file": _file("3", "new.csv")},
+                {"fileId": "2", "file": _file("2", "summary.csv", "elsewhere")},
+            ],
+        },
+        {"changes": [{"fileId": "1", "removed": True}], "newStartPageToken": "t3"},
+    ]
+
+    index: DriveIndex = indexed_client.index  # type: ignore[assignment]
+    assert index.sync() == 3
+    assert [f["id"] for f in index.list_folder("folder")] == ["3"]
+    index.close()
+
+    reopened: DriveIndex = DriveIndex(indexed_client, str(tmp_path / "index.sqlite"))
+    assert reopened._get_state("page_token") == "t3"
+    assert reopened.covers("folder")
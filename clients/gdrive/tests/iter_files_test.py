@@ -0,0 +1,74 @@
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.client import PREFETCH_WORKERS
+
+
+def _pages(*sizes: int) -> list[dict[str, Any]]:
+    pages: list[dict[str, Any]] = []
+    counter: int = 0
+    for number, size in enumerate(sizes):
+        files = [
+            {"id": str(counter + i), "name": f"f{counter + i}"} for i in range(size)
+        ]
+        counter += size
+        page: dict[str, Any] = {"files": files}
+        if number < len(sizes) - 1:
+            page["nextPageToken"] = f"token{number + 1}"
+        pages.append(page)
+    return pages
+
+
+@pytest.mark.unit
+def test_iter_files_streams_every_page(mock_client: GDriveClient) -> None:
+    """All pages are yielded in order with the maximum page size."""
+    files: MagicMock = mock_client.service.files()
+    files.list.return_value.execute.side_effect = _pages(2, 2, 1)
+
+    ids: list[str] = [f["id"] for f in mock_client.iter_files("q")]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    tokens: list[Any] = [c.kwargs["pageToken"] for c in files.list.call_args_list]
+    assert tokens == [None, "token1", "token2"]
+    assert files.list.call_args.kwargs["pageSize"] == 1000
+
+
+@pytest.mark.unit
+def test_list_files_spans_pages_without_overfetching(
+    mock_client: GDriveClient,
+) -> None:
+    """list_files can exceed one page and stops prefetching at the limit."""
+    files: MagicMock = mock_client.service.files()
+    files.list.return_value.execute.side_effect = _pages(3, 3, 3)
+
+    listed: list[dict[str, str]] = mock_client.list_files("folder", limit=5)
+
+    assert [f["id"] for f in listed] == ["0", "1", "2", "3", "4"]
+    assert files.list.return_value.execute.call_count == 2
+
+
+@pytest.mark.unit
+def test_listings_reuse_the_calling_and_prefetch_threads(
+    mock_client: GDriveClient,
+) -> None:
+    """Page 1 uses the caller's thread; later pages reuse long-lived workers."""
+    threads: list[str] = []
+    pages: list[dict[str, Any]] = _pages(1, 1, 1) * 5
+
+    def _execute(_request: Any) -> dict[str, Any]:
+        threads.append(threading.current_thread().name)
+        return pages.pop(0)
+
+    mock_client._execute = MagicMock(side_effect=_execute)  # type: ignore[method-assign]
+    for _ in range(5):
+        assert len(list(mock_client.iter_files("q"))) == 3
+
+    caller: str = threading.current_thread().name
+    assert threads[::3] == [caller] * 5
+    workers: set[str] = set(threads) - {caller}
+    assert workers and all(name.startswith("gdrive-prefetch") for name in workers)
+    assert len(workers) <= PREFETCH_WORKERS
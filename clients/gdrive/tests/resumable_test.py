@@ -0,0 +1,98 @@
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.resumable import UploadSessionStore
+from clients.gdrive.tests.helpers import FakeResponse
+
+
+@pytest.mark.unit
+def test_session_store_rejects_modified_files(tmp_path: Path) -> None:
+    """A session is only returned while the local file is unchanged."""
+    local: Path = tmp_path / "model.bin"
+    local.write_bytes(b"v1")
+    store: UploadSessionStore = UploadSessionStore(str(tmp_path / "sessions.json"))
+
+    store.save("key", str(local), "https://upload/session", 256)
+    session: dict[str, Any] | None = store.get("key", str(local))
+    assert session is not None
+    assert session["offset"] == 256
+
+    local.write_bytes(b"v2 changed")
+    assert store.get("key", str(local)) is None
+
+
+@pytest.mark.unit
+def test_stores_sharing_a_file_keep_every_session(tmp_path: Path) -> None:
+    """Separate stores on one sidecar (as separate processes) merge their updates."""
+    local: Path = tmp_path / "model.bin"
+    local.write_bytes(b"v1")
+    path: str = str(tmp_path / "sessions.json")
+
+    threads: list[threading.Thread] = [
+        threading.Thread(
+            target=UploadSessionStore(path).save,
+            args=(f"key-{i}", str(local), f"https://upload/{i}", i),
+        )
+        for i in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    store: UploadSessionStore = UploadSessionStore(path)
+    assert all(store.get(f"key-{i}", str(local)) is not None for i in range(8))
+
+
+@pytest.mark.unit
+def test_upload_resumes_from_committed_offset(
+    mock_client: GDriveClient, tmp_path: Path
+) -> None:
+    """A saved session is probed and the upload continues from Drive's offset."""
+    local: Path = tmp_path / "big.parquet"
+    local.write_bytes(b"x" * 1024)
+    key: str = f"{local}|folder"
+    mock_client.upload_sessions.save(key, str(local), "https://upload/s1", 256)
+
+    http: MagicMock = MagicMock()
+    http.request.return_value = (FakeResponse(308, {"range": "bytes=0-511"}), b"")
+    mock_client._thread_http = MagicMock(return_value=http)  # type: ignore[method-assign]
+
+    request: MagicMock = mock_client.service.files().create.return_value
+    request.next_chunk.return_value = (None, {"id": "done"})
+
+    assert mock_client.upload_file(str(local), "folder", overwrite=False) == "done"
+    assert request.resumable_uri == "https://upload/s1"
+    assert request.resumable_progress == 512
+    assert mock_client.upload_sessions.get(key, str(local)) is None
+
+
+@pytest.mark.unit
+def test_transient_probe_failure_keeps_the_session(
+    mock_client: GDriveClient, tmp_path: Path
+) -> None:
+    """A 503 on the status probe is retried; progress is not thrown away."""
+    local: Path = tmp_path / "big.parquet"
+    local.write_bytes(b"x" * 1024)
+    key: str = f"{local}|folder"
+    mock_client.upload_sessions.save(key, str(local), "https://upload/s1", 256)
+
+    http: MagicMock = MagicMock()
+    http.request.side_effect = [
+        (FakeResponse(503, reason="Service Unavailable"), b""),
+        (FakeResponse(308, {"range": "bytes=0-511"}), b""),
+    ]
+    mock_client._thread_http = MagicMock(return_value=http)  # type: ignore[method-assign]
+
+    request: MagicMock = mock_client.service.files().create.return_value
+    request.next_chunk.return_value = (None, {"id": "done"})
+
+    assert mock_client.upload_file(str(local), "folder", overwrite=False) == "done"
+    assert http.request.call_count == 2
+    assert request.resumable_uri == "https://upload/s1"
+    assert request.resumable_progress == 512
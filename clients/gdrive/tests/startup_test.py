@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient, clear_gdrive_clients, get_gdrive_client
+from clients.gdrive.gdrive_client import client as client_module
+
+
+@pytest.fixture
+def creds_path(tmp_path: Path) -> Iterator[str]:
+    path: Path = tmp_path / "credentials.json"
+    path.write_text("{}")
+    yield str(path)
+    clear_gdrive_clients()
+
+
+@pytest.mark.unit
+def test_service_is_built_on_first_use(
+    creds_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Construction does no OAuth work; the bundled discovery doc is used once."""
+    load_creds: MagicMock = MagicMock(return_value="creds")
+    build: MagicMock = MagicMock()
+    monkeypatch.setattr(client_module, "get_google_service_credentials", load_creds)
+    monkeypatch.setattr(client_module, "build", build)
+
+    client: GDriveClient = GDriveClient(
+        credentials_path=creds_path, token_path=str(tmp_path / "token.json")
+    )
+    load_creds.assert_not_called()
+
+    assert client.service is client.service
+    assert client.creds == "creds"
+    build.assert_called_once_with(
+        "drive",
+        "v3",
+        credentials="creds",
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+@pytest.mark.unit
+def test_registry_shares_one_client_per_configuration(
+    creds_path: str, tmp_path: Path
+) -> None:
+    """Same credentials, token and scopes reuse the client; other scopes do not."""
+    token: str = str(tmp_path / "token.json")
+    readonly: list[str] = ["https://www.googleapis.com/auth/drive.readonly"]
+
+    first: GDriveClient = get_gdrive_client(creds_path, token)
+    assert get_gdrive_client(creds_path, token) is first
+    assert get_gdrive_client(creds_path, token, scopes=readonly) is not first
+
+    clear_gdrive_clients()
+    assert get_gdrive_client(creds_path, token) is not first
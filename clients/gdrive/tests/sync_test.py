@@ -0,0 +1,89 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.tests.helpers import BatchRecorder
+
+
+def _remote(file_id: str, name: str, content: bytes) -> dict[str, Any]:
+    return {
+        "id": file_id,
+        "name": name,
+        "md5Checksum": hashlib.md5(content, usedforsecurity=False).hexdigest(),
+        "size": str(len(content)),
+        "modifiedTime": "2026-01-01T00:00:00.000Z",
+    }
+
+
+@pytest.mark.unit
+def test_sync_up_transfers_only_changes(
+    mock_client: GDriveClient, batches: BatchRecorder, tmp_path: Path
+) -> None:
+    """Unchanged files are skipped, changed/new ones uploaded, orphans deleted."""
+    local_dir: Path = tmp_path / "mirror"
+    local_dir.mkdir()
+    (local_dir / "same.csv").write_bytes(b"same")
+    (local_dir / "edited.csv").write_bytes(b"new content")
+    (local_dir / "added.csv").write_bytes(b"added")
+
+    mock_client._fetch_files = MagicMock(  # type: ignore[method-assign]
+        return_value=[
+            _remote("1", "same.csv", b"same"),
+            _remote("2", "edited.csv", b"old content"),
+            _remote("3", "orphan.csv", b"gone"),
+        ]
+    )
+    mock_client._upload_media = MagicMock(return_value="uploaded")  # type: ignore[method-assign]
+
+    report: dict[str, Any] = mock_client.sync_folder(
+        str(local_dir), "folder", direction="up", delete_orphans=True
+    )
+
+    assert report["unchanged"] == ["same.csv"]
+    assert sorted(report["transferred"]) == ["added.csv", "edited.csv"]
+    assert report["deleted"] == ["orphan.csv"]
+    targets: dict[str, Any] = {
+        os.path.basename(c.args[0]): c.args[2]
+        for c in mock_client._upload_media.call_args_list
+    }
+    assert targets == {"added.csv": None, "edited.csv": "2"}
+
+
+@pytest.mark.unit
+def test_sync_down_downloads_missing_and_aligns_mtime(
+    mock_client: GDriveClient, tmp_path: Path
+) -> None:
+    """Missing files are downloaded and stamped with Drive's modifiedTime."""
+    local_dir: Path = tmp_path / "mirror"
+    mock_client._fetch_files = MagicMock(  # type: ignore[method-assign]
+        return_value=[_remote("1", "data.csv", b"payload")]
+    )
+
+    def _fake_download(mapping: dict[str, str], max_workers: int) -> dict[str, Any]:
+        for path in mapping.values():
+            Path(path).write_bytes(b"payload")
+        return {
+            "files": [
+                {"id": fid, "path": path, "bytes": 7, "error": None}
+                for fid, path in mapping.items()
+            ]
+        }
+
+    mock_client.download_files = _fake_download  # type: ignore[method-assign]
+
+    report: dict[str, Any] = mock_client.sync_folder(
+        str(local_dir), "folder", direction="down"
+    )
+    assert report["transferred"] == ["data.csv"]
+
+    # Second run: size and mtime match, so nothing is transferred or hashed
+    again: dict[str, Any] = mock_client.sync_folder(
+        str(local_dir), "folder", direction="down"
+    )
+    assert again["unchanged"] == ["data.csv"]
+    assert again["transferred"] == []
@@ -0,0 +1,95 @@
+import re
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clients.gdrive import GDriveClient
+from clients.gdrive.gdrive_client.client import FOLDER_MIME_TYPE, MAX_QUERY_LENGTH
+
+# parent -> children as (id, name, is_folder)
+TREE: dict[str, list[tuple[str, str, bool]]] = {
+    "root": [("a", "a", True), ("b", "b", True), ("r1", "readme.md", False)],
+    "a": [("c", "c", True), ("a1", "a1.csv", False)],
+    "b": [("b1", "b1.csv", False), ("b2", "b2.csv", False)],
+    "c": [("c1", "deep.csv", False)],
+}
+
+
+def _wire_tree(
+    client: GDriveClient,
+    tree: dict[str, list[tuple[str, str, bool]]],
+    queries: list[str],
+    page_size: int,
+) -> None:
+    """Answers files().list from 'tree', 'page_size' files per page."""
+    client.service.files().list.side_effect = lambda **kwargs: kwargs
+
+    def _execute(request: dict[str, Any]) -> dict[str, Any]:
+        queries.append(request["q"])
+        parents: list[str] = re.findall(r"'([^']+)' in parents", request["q"])
+        files: list[dict[str, Any]] = [
+            {
+                "id": fid,
+                "name": name,
+                "parents": [parent],
+                "mimeType": FOLDER_MIME_TYPE if is_folder else "text/csv",
+            }
+            for parent in parents
+            for fid, name, is_folder in tree.get(parent, [])
+        ]
+        offset: int = int(request["pageToken"] or 0)
+        response: dict[str, Any] = {"files": files[offset : offset + page_size]}
+        if offset + page_size < len(files):
+            response["nextPageToken"] = str(offset + page_size)
+        return response
+
+    client._execute = MagicMock(side_effect=_execute)  # type: ignore[method-assign]
+
+
+@pytest.mark.unit
+def test_walk_yields_relative_paths(mock_client: GDriveClient) -> None:
+    """Every level is crawled; sibling folders share one OR-ed query."""
+    queries: list[str] = []
+    _wire_tree(mock_client, TREE, queries, page_size=10)
+
+    paths: set[str] = {path for path, _ in mock_client.walk("root")}
+
+    assert paths == {
+        "a",
+        "b",
+        "readme.md",
+        "a/c",
+        "a/a1.csv",
+        "b/b1.csv",
+        "b/b2.csv",
+        "a/c/deep.csv",
+    }
+    assert any("'a' in parents or 'b' in parents" in q for q in queries)
+
+
+@pytest.mark.unit
+def test_walk_respects_max_depth(mock_client: GDriveClient) -> None:
+    """max_depth limits descent; paged results are followed to the end."""
+    _wire_tree(mock_client, TREE, [], page_size=1)
+
+    top: set[str] = {path for path, _ in mock_client.walk("root", max_depth=0)}
+    two_levels: set[str] = {path for path, _ in mock_client.walk("root", max_depth=1)}
+
+    assert top == {"a", "b", "readme.md"}
+    assert two_levels == top | {"a/c", "a/a1.csv", "b/b1.csv", "b/b2.csv"}
+
+
+@pytest.mark.unit
+def test_walk_splits_long_queries(mock_client: GDriveClient) -> None:
+    """Hundreds of sibling folders are spread over queries under the length limit."""
+    folder_ids: list[str] = [f"folder_{i:04d}_{'x' * 20}" for i in range(300)]
+    tree: dict[str, list[tuple[str, str, bool]]] = {
+        "root": [(fid, fid, True) for fid in folder_ids]
+    }
+    queries: list[str] = []
+    _wire_tree(mock_client, tree, queries, page_size=1000)
+
+    assert len(list(mock_client.walk("root"))) == 300
+    assert all(len(q) <= MAX_QUERY_LENGTH for q in queries)
+    assert 1 < len(queries) < 300 // 10